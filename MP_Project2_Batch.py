@@ -0,0 +1,60 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Vectorized batch evaluator
+Overview:
+    Scores many boards at once with NumPy instead of one nested list at
+    a time. Boards are an (N, 9) int8 array in row-major cell order,
+    using the same encoding as TicTacToeML._board_to_features in Part C:
+    X = 1, O = -1, empty = 0. For every board we return the winner,
+    whether the game is over, and which cells are legal moves.
+-----------------------------------------------------------------------------
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+# Cell indices of the 8 winning lines: rows, cols, diagonals
+LINE_INDEX = np.array(
+    [
+        [0, 1, 2], [3, 4, 5], [6, 7, 8],
+        [0, 3, 6], [1, 4, 7], [2, 5, 8],
+        [0, 4, 8], [2, 4, 6],
+    ],
+    dtype=np.intp,
+)
+
+MAPPING = {"X": 1, "O": -1, " ": 0}
+
+
+def boards_to_array(boards: List[List[List[str]]]) -> np.ndarray:
+    """
+    Encode a list of 3x3 string boards as an (N, 9) int8 array.
+    """
+    flat = [[MAPPING[cell] for row in board for cell in row] for board in boards]
+    return np.array(flat, dtype=np.int8).reshape(-1, 9)
+
+
+def evaluate_batch(boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate an (N, 9) batch of boards.
+
+    Returns (winner, terminal, legal):
+        winner   (N,) int8, 1 if X has a line, -1 if O has a line, else 0
+        terminal (N,) bool, True if someone won or the board is full
+        legal    (N, 9) bool, empty cells of boards that are still in play
+    """
+    boards = np.asarray(boards, dtype=np.int8).reshape(-1, 9)
+
+    # (N, 8) line sums: +3 is an X line, -3 an O line
+    sums = boards[:, LINE_INDEX].sum(axis=2, dtype=np.int8)
+    x_win = (sums == 3).any(axis=1)
+    o_win = (sums == -3).any(axis=1)
+    winner = np.where(x_win, 1, np.where(o_win, -1, 0)).astype(np.int8)
+
+    legal = boards == 0
+    terminal = x_win | o_win | ~legal.any(axis=1)
+    legal &= ~terminal[:, None]
+    return winner, terminal, legal
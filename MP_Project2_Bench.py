@@ -0,0 +1,220 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Benchmark suite
+Overview:
+    Times the hot paths of the game with warm-up runs, repeated runs and
+    percentile latencies:
+        - TicTacToe.minimax node rate
+        - get_best_move from the empty board and from mid-game positions
+        - checkWin / checkFull
+        - _board_to_features + model.predict (Part C)
+        - train_svc_model_from_dataset wall time (Part C)
+    The Part C benchmarks are skipped if scikit-learn or tictac_single.txt
+    is not available. Results are written as JSON; --compare checks them
+    against a stored baseline and exits with status 1 on a regression.
+
+    Example:
+        python MP_Project2_Bench.py --output baseline.json
+        python MP_Project2_Bench.py --compare baseline.json
+-----------------------------------------------------------------------------
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from MP_Project2_PartB import TicTacToe, TranspositionTable
+
+# A few positions with O to move, from early to late game
+MID_GAME = {
+    "center_open": [[" ", " ", " "], [" ", "X", " "], [" ", " ", " "]],
+    "corner_fork": [["X", " ", " "], [" ", "O", " "], [" ", " ", "X"]],
+    "late_block": [["X", "O", "X"], [" ", "X", " "], [" ", " ", "O"]],
+}
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """
+    q-th percentile (0-100) of the samples, linearly interpolated.
+    """
+    ordered = sorted(samples)
+    pos = (len(ordered) - 1) * q / 100.0
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def measure(fn: Callable[[], object], repeats: int, warmup: int, inner: int = 1) -> Dict[str, float]:
+    """
+    Time fn() after warm-up calls. With inner > 1, each sample is the
+    average over that many back-to-back calls (for very cheap functions).
+    Times are in seconds.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(inner):
+            fn()
+        samples.append((time.perf_counter() - start) / inner)
+    return {
+        "repeats": repeats,
+        "mean": sum(samples) / len(samples),
+        "min": min(samples),
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+    }
+
+
+def bench_minimax_nodes(repeats: int, warmup: int) -> Dict[str, float]:
+    """
+    Exhaustive minimax from the 'center_open' position, transposition table off.
+    """
+    game = TicTacToe(search="minimax", table=TranspositionTable(max_size=0))
+    board = MID_GAME["center_open"]
+
+    def run():
+        game.board = [row[:] for row in board]
+        game.get_best_move()
+
+    game.nodes = 0
+    run()
+    nodes = game.nodes
+    result = measure(run, repeats, warmup)
+    result["nodes"] = nodes
+    result["nodes_per_sec"] = nodes / result["p50"]
+    return result
+
+
+def bench_best_move(board: List[List[str]], repeats: int, warmup: int) -> Dict[str, float]:
+    """
+    Default (alpha-beta) get_best_move with a cold transposition table each run.
+    """
+    def run():
+        game = TicTacToe(table=TranspositionTable())
+        game.board = [row[:] for row in board]
+        game.get_best_move()
+
+    return measure(run, repeats, warmup)
+
+
+def bench_checks(repeats: int, warmup: int) -> Dict[str, Dict[str, float]]:
+    """
+    Per-call cost of checkWin and checkFull on a late-game board.
+    """
+    game = TicTacToe()
+    game.board = [row[:] for row in MID_GAME["late_block"]]
+    return {
+        "checkWin": measure(lambda: game.checkWin("X"), repeats, warmup, inner=1000),
+        "checkFull": measure(game.checkFull, repeats, warmup, inner=1000),
+    }
+
+
+def bench_partc(repeats: int, warmup: int, train_repeats: int) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    Part C inference and training; None when the model cannot be trained here.
+    """
+    try:
+        from MP_Project2_PartC import TicTacToeML, load_or_train_svc_model, train_svc_model_from_dataset
+        model = load_or_train_svc_model()
+    except (ImportError, OSError) as err:
+        print(f"Skipping Part C benchmarks: {err}")
+        return None
+
+    game = TicTacToeML(model)
+    game.board = [row[:] for row in MID_GAME["corner_fork"]]
+    return {
+        "ml_predict": measure(
+            lambda: game.model.predict(game._board_to_features()), repeats, warmup
+        ),
+        "svc_training": measure(train_svc_model_from_dataset, train_repeats, 0),
+    }
+
+
+def run_all(repeats: int, warmup: int, train_repeats: int) -> Dict[str, Dict[str, float]]:
+    """
+    Run every benchmark and return {name: stats}.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    results["minimax_nodes"] = bench_minimax_nodes(max(3, repeats // 10), 1)
+    results["best_move_empty"] = bench_best_move([[" "] * 3 for _ in range(3)], repeats, warmup)
+    for name, board in MID_GAME.items():
+        results[f"best_move_{name}"] = bench_best_move(board, repeats, warmup)
+    results.update(bench_checks(repeats, warmup))
+    partc = bench_partc(repeats, warmup, train_repeats)
+    if partc is not None:
+        results.update(partc)
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """
+    Print p50 ratios against the baseline and return the names that regressed.
+    """
+    regressions = []
+    print(f"{'benchmark':<28}{'baseline p50':>14}{'current p50':>14}{'ratio':>8}")
+    for name, stats in current.items():
+        if name not in baseline:
+            print(f"{name:<28}{'-':>14}{stats['p50']:>14.6f}{'new':>8}")
+            continue
+        ratio = stats["p50"] / baseline[name]["p50"]
+        flag = ""
+        if ratio > 1.0 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<28}{baseline[name]['p50']:>14.6f}{stats['p50']:>14.6f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Tic-Tac-Toe hot paths.")
+    parser.add_argument("--repeats", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--train-repeats", type=int, default=1)
+    parser.add_argument("--output", default="bench_results.json", help="where to save the JSON results")
+    parser.add_argument("--compare", default=None, help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed p50 slowdown (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    # Read the baseline before anything is written, in case --output points at it
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["benchmarks"]
+    overwrites_baseline = args.compare is not None and os.path.realpath(args.output) == os.path.realpath(args.compare)
+
+    results = run_all(args.repeats, args.warmup, args.train_repeats)
+    report = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": results,
+    }
+    if overwrites_baseline:
+        print(f"Not saving results: {args.output} is the --compare baseline (pass a different --output)")
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            sys.exit(1)
+        print("No regressions.")
+    else:
+        for name, stats in results.items():
+            print(f"{name:<28} p50 {stats['p50'] * 1e3:10.4f} ms   p90 {stats['p90'] * 1e3:10.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
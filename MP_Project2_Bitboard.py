@@ -0,0 +1,251 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Bitboard representation
+Overview:
+    An alternative board storage for the Part A/B/C games. Instead of a
+    3x3 list of strings, the board is two 9-bit integers: one for the X
+    marks and one for the O marks (bit index = row * 3 + col).
+    Win detection is 8 precomputed mask ANDs and empty cells are found
+    with bit tricks. Indexing as board[r][c] still works, so the existing
+    printBoard/validateEntry/move code runs on it unchanged.
+-----------------------------------------------------------------------------
+"""
+from typing import Iterator, List, Set, Tuple
+
+FULL_MASK = 0b111111111
+
+# Rows, columns and diagonals as bit masks
+WIN_MASKS = [
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+]
+
+
+def _symmetry_tables() -> List[List[List[int]]]:
+    """
+    For each of the 8 rotations/reflections, lookup tables that map each
+    3-bit row chunk of a bitboard to its transformed bits.
+    """
+    tables = []
+    for flip in (False, True):
+        for turns in range(4):
+            dest = []
+            for r in range(3):
+                for c in range(3):
+                    rr, cc = r, c
+                    for _ in range(turns):
+                        rr, cc = cc, 2 - rr
+                    if flip:
+                        cc = 2 - cc
+                    dest.append(rr * 3 + cc)
+            chunks = []
+            for row in range(3):
+                chunk = []
+                for value in range(8):
+                    bits = 0
+                    for c in range(3):
+                        if value >> c & 1:
+                            bits |= 1 << dest[row * 3 + c]
+                    chunk.append(bits)
+                chunks.append(chunk)
+            tables.append(chunks)
+    return tables
+
+
+SYMMETRY_TABLES = _symmetry_tables()
+
+# TERNARY[mask] is the base-3 value of a 9-bit mask (cell i weighs 3 ** i),
+# so a board's base-3 index (X=1, O=2) is TERNARY[x] + 2 * TERNARY[o]
+TERNARY = [
+    sum(3 ** i for i in range(9) if mask >> i & 1) for mask in range(512)
+]
+
+
+def transform(bits: int, table: List[List[int]]) -> int:
+    """
+    Apply one symmetry table to a 9-bit mask.
+    """
+    return table[0][bits & 7] | table[1][(bits >> 3) & 7] | table[2][bits >> 6]
+
+
+def has_win(bits: int) -> bool:
+    """
+    True if the mask of one player's marks covers a winning line.
+    """
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def empty_cells(x: int, o: int) -> Iterator[int]:
+    """
+    Yield the indices of empty cells, lowest first, by peeling off the low bit.
+    """
+    free = ~(x | o) & FULL_MASK
+    while free:
+        low = free & -free
+        yield low.bit_length() - 1
+        free ^= low
+
+
+def reachable(to_move: str = "O") -> List[Tuple[int, int]]:
+    """
+    Every reachable, unfinished (x, o) position with 'to_move' to play.
+    X always moves first, so O is to move whenever X has one extra mark.
+    """
+    found: List[Tuple[int, int]] = []
+    seen: Set[Tuple[int, int]] = set()
+    stack = [(0, 0)]
+    while stack:
+        x, o = stack.pop()
+        if (x, o) in seen:
+            continue
+        seen.add((x, o))
+        if has_win(x) or has_win(o) or (x | o) == FULL_MASK:
+            continue
+        x_turn = bin(x).count("1") == bin(o).count("1")
+        if x_turn == (to_move == "X"):
+            found.append((x, o))
+        for idx in empty_cells(x, o):
+            if x_turn:
+                stack.append((x | 1 << idx, o))
+            else:
+                stack.append((x, o | 1 << idx))
+    found.sort()
+    return found
+
+
+class _RowView:
+    """
+    One row of a BitBoard, so that board[r][c] reads and writes still work.
+    """
+
+    __slots__ = ("board", "row")
+
+    def __init__(self, board: "BitBoard", row: int):
+        self.board = board
+        self.row = row
+
+    def __getitem__(self, col: int) -> str:
+        return self.board.get(self.row * 3 + col)
+
+    def __setitem__(self, col: int, mark: str) -> None:
+        idx = self.row * 3 + col
+        if mark == " ":
+            self.board.remove(idx)
+        else:
+            self.board.place(idx, mark)
+
+    def __iter__(self) -> Iterator[str]:
+        for col in range(3):
+            yield self.board.get(self.row * 3 + col)
+
+    def __len__(self) -> int:
+        return 3
+
+
+class BitBoard:
+    """
+    3x3 board stored as two 9-bit integers (x marks, o marks).
+    """
+
+    __slots__ = ("x", "o")
+
+    def __init__(self, x: int = 0, o: int = 0):
+        self.x = x
+        self.o = o
+
+    def __getitem__(self, row: int) -> _RowView:
+        return _RowView(self, row)
+
+    def __iter__(self) -> Iterator[_RowView]:
+        for row in range(3):
+            yield _RowView(self, row)
+
+    def __len__(self) -> int:
+        return 3
+
+    def reset(self) -> None:
+        """
+        Clear all marks.
+        """
+        self.x = 0
+        self.o = 0
+
+    def copy(self) -> "BitBoard":
+        return BitBoard(self.x, self.o)
+
+    def get(self, idx: int) -> str:
+        """
+        Mark at a cell index: "X", "O" or " ".
+        """
+        bit = 1 << idx
+        if self.x & bit:
+            return "X"
+        if self.o & bit:
+            return "O"
+        return " "
+
+    def place(self, idx: int, mark: str) -> None:
+        """
+        Put a mark on a cell (the cell is overwritten if it was taken).
+        """
+        bit = 1 << idx
+        if mark == "X":
+            self.x |= bit
+            self.o &= ~bit
+        else:
+            self.o |= bit
+            self.x &= ~bit
+
+    def remove(self, idx: int) -> None:
+        """
+        Clear a cell.
+        """
+        keep = ~(1 << idx)
+        self.x &= keep
+        self.o &= keep
+
+    def is_win(self, mark: str) -> bool:
+        return has_win(self.x if mark == "X" else self.o)
+
+    def is_full(self) -> bool:
+        return (self.x | self.o) == FULL_MASK
+
+    def empty_cells(self) -> Iterator[int]:
+        return empty_cells(self.x, self.o)
+
+    def count(self) -> int:
+        """
+        Number of marks on the board.
+        """
+        return bin(self.x | self.o).count("1")
+
+    def canonical(self) -> int:
+        """
+        Smallest (o << 9 | x) over the 8 symmetries, shared by all of them.
+        """
+        return min(
+            transform(self.o, table) << 9 | transform(self.x, table)
+            for table in SYMMETRY_TABLES
+        )
+
+    def ternary(self) -> int:
+        """
+        Base-3 index of the board (X=1, O=2, empty=0), in the range 0..3**9-1.
+        """
+        return TERNARY[self.x] + 2 * TERNARY[self.o]
+
+    def features(self) -> List[int]:
+        """
+        X=1, O=-1, empty=0 for the 9 cells in row-major order.
+        """
+        return [
+            1 if self.x >> i & 1 else -1 if self.o >> i & 1 else 0
+            for i in range(9)
+        ]
@@ -0,0 +1,108 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Binary dataset cache
+Overview:
+    Parsing tictac_single.txt with np.loadtxt on every run is slow and
+    keeps the whole file in memory as float64. load_dataset() converts a
+    text dataset once into a cache directory next to it:
+        <file>.cache/features.npy   int8, one row of 9 cells per board
+        <file>.cache/labels.npy     uint8, one column or several (multi-label)
+        <file>.cache/meta.json      size, mtime and sha256 of the text file
+    Later loads memory-map the .npy files. The cache is rebuilt when the
+    text file's size or hash changes (the mtime is only a shortcut).
+    The same loader works for tictac_multi.txt / tictac_final.txt.
+-----------------------------------------------------------------------------
+"""
+import hashlib
+import json
+import os
+from typing import Tuple
+
+import numpy as np
+
+N_FEATURES = 9
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_dir(path: str) -> str:
+    """
+    Directory holding the binary cache for a text dataset.
+    """
+    return path + ".cache"
+
+
+def _cache_is_fresh(path: str, meta_path: str) -> bool:
+    """
+    True if the cache matches the text file. When only the mtime moved,
+    the hash decides and the stored mtime is refreshed.
+    """
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    stat = os.stat(path)
+    if meta.get("size") != stat.st_size:
+        return False
+    if meta.get("mtime") == stat.st_mtime_ns:
+        return True
+    if meta.get("sha256") != _file_hash(path):
+        return False
+    meta["mtime"] = stat.st_mtime_ns
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+    return True
+
+
+def convert_dataset(path: str) -> None:
+    """
+    Parse the text dataset once and write the binary cache.
+    """
+    data = np.loadtxt(path)
+    features = data[:, :N_FEATURES].astype(np.int8)
+    labels = data[:, N_FEATURES:].astype(np.uint8)
+    if labels.shape[1] == 1:
+        labels = labels[:, 0]
+
+    out = cache_dir(path)
+    os.makedirs(out, exist_ok=True)
+    np.save(os.path.join(out, "features.npy"), features)
+    np.save(os.path.join(out, "labels.npy"), labels)
+
+    stat = os.stat(path)
+    meta = {
+        "source": os.path.basename(path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "sha256": _file_hash(path),
+        "rows": int(features.shape[0]),
+        "label_columns": int(labels.shape[1]) if labels.ndim == 2 else 1,
+    }
+    # meta.json is written last, so a half-written cache is never treated as fresh
+    with open(os.path.join(out, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+
+def load_dataset(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (features, labels) for a tictac text dataset, memory-mapped from the
+    binary cache. Single-label files give labels of shape (N,), multi-label
+    files (N, k).
+    """
+    out = cache_dir(path)
+    if not _cache_is_fresh(path, os.path.join(out, "meta.json")):
+        convert_dataset(path)
+    features = np.load(os.path.join(out, "features.npy"), mmap_mode="r")
+    labels = np.load(os.path.join(out, "labels.npy"), mmap_mode="r")
+    return features, labels
@@ -0,0 +1,177 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - SVC player vs perfect play
+Overview:
+    Measures how well the Part C model actually plays, instead of how
+    well it fits the training labels. Every reachable position with O to
+    move is predicted in one model.predict() call and compared with
+    perfect play:
+        agreement  the move played is one of the optimal moves
+        illegal    the raw prediction is an occupied cell, so _ml_move's
+                   first-free-cell fallback plays instead
+        blunder    the move turns a drawn position into a loss for O
+        missed win the position is won for O but the move does not keep the win
+    Perfect play comes from solve_values(), which solves all 3**9 boards
+    layer by layer (full boards first) with array operations, so the
+    whole evaluation runs in well under a second once the model is loaded.
+    Results are also broken down by the number of marks on the board.
+
+    Example:
+        python MP_Project2_Evaluate.py
+        python MP_Project2_Evaluate.py --numpy-svc
+-----------------------------------------------------------------------------
+"""
+import argparse
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from MP_Project2_Batch import evaluate_batch
+from MP_Project2_Solution import TABLE_SIZE
+
+# Weight of each cell in a base-3 board index (X=1, O=2)
+POWERS = 3 ** np.arange(9)
+
+
+def all_boards() -> np.ndarray:
+    """
+    (3**9, 9) int8 features (X=1, O=-1, empty=0) of every board, row i having base-3 index i.
+    """
+    digits = (np.arange(TABLE_SIZE)[:, None] // POWERS) % 3
+    return np.where(digits == 2, -1, digits).astype(np.int8)
+
+
+def solve_values() -> np.ndarray:
+    """
+    Perfect-play value of every board for X (1 win, 0 draw, -1 loss), indexed
+    by base-3 board index. Boards with impossible mark counts are left at 0.
+    """
+    boards = all_boards()
+    x_count = (boards == 1).sum(axis=1)
+    o_count = (boards == -1).sum(axis=1)
+    valid = (x_count == o_count) | (x_count == o_count + 1)
+    winner, terminal, legal = evaluate_batch(boards)
+
+    values = np.zeros(TABLE_SIZE, dtype=np.int8)
+    indices = np.arange(TABLE_SIZE)
+    marks = x_count + o_count
+    # A board's children have one more mark, so solve from full boards down
+    for n in range(9, -1, -1):
+        layer = indices[valid & (marks == n)]
+        done = terminal[layer]
+        values[layer[done]] = winner[layer[done]]
+
+        open_ = layer[~done]
+        if len(open_) == 0:
+            continue
+        x_turn = x_count[open_] == o_count[open_]
+        digit = np.where(x_turn, 1, 2)
+        moves = legal[open_]
+        children = values[np.where(moves, open_[:, None] + digit[:, None] * POWERS, 0)]
+        # X maximizes and O minimizes; illegal cells can never be chosen
+        best_x = np.where(moves, children, -2).max(axis=1)
+        best_o = np.where(moves, children, 2).min(axis=1)
+        values[open_] = np.where(x_turn, best_x, best_o)
+    return values
+
+
+def evaluate_model(model, values: Optional[np.ndarray] = None) -> Dict[str, object]:
+    """
+    Compare model.predict() with perfect play on every reachable O-to-move position.
+    """
+    # Imported here so solve_values() works without scikit-learn
+    from MP_Project2_PartC import board_indices, o_to_move_features
+
+    if values is None:
+        values = solve_values()
+    features = o_to_move_features()
+    index = board_indices(features)
+    rows = np.arange(len(features))
+    legal = features == 0
+
+    start = time.perf_counter()
+    raw = np.asarray(model.predict(features)).astype(int)
+    predict_seconds = time.perf_counter() - start
+
+    # Same fallback as TicTacToeML._livePredict: first free cell
+    illegal = (raw < 0) | (raw > 8)
+    illegal[~illegal] = ~legal[rows[~illegal], raw[~illegal]]
+    played = np.where(illegal, legal.argmax(axis=1), raw)
+
+    # O's result after each move (O's view, so negated X values), optimal where it matches the best
+    after = np.where(legal, -values[np.where(legal, index[:, None] + 2 * POWERS, 0)], -2)
+    best = after.max(axis=1)
+    chosen = after[rows, played]
+    optimal = chosen == best
+
+    blunder = (best == 0) & (chosen < 0)
+    missed_win = (best == 1) & (chosen < 1)
+    drawn = best == 0
+    won = best == 1
+
+    marks = legal.shape[1] - legal.sum(axis=1)
+    by_marks = {}
+    for n in np.unique(marks):
+        sel = marks == n
+        by_marks[int(n)] = {
+            "positions": int(sel.sum()),
+            "agreement": float(optimal[sel].mean()),
+            "illegal": float(illegal[sel].mean()),
+            "blunders": int(blunder[sel].sum()),
+        }
+
+    return {
+        "positions": len(features),
+        "predict_seconds": predict_seconds,
+        "agreement": float(optimal.mean()),
+        "illegal_rate": float(illegal.mean()),
+        "blunder_rate": float(blunder.sum() / max(drawn.sum(), 1)),
+        "blunders": int(blunder.sum()),
+        "drawn_positions": int(drawn.sum()),
+        "missed_wins": int(missed_win.sum()),
+        "won_positions": int(won.sum()),
+        "by_marks": by_marks,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the SVC player against perfect play.")
+    parser.add_argument("--numpy-svc", action="store_true", help="evaluate the exported NumPy predictor")
+    parser.add_argument("--retrain", action="store_true", help="ignore the cached model and train again")
+    args = parser.parse_args()
+
+    from MP_Project2_PartC import load_numpy_svc, load_or_train_svc_model
+
+    loader = load_numpy_svc if args.numpy_svc else load_or_train_svc_model
+    model = loader(force_retrain=args.retrain)
+
+    start = time.perf_counter()
+    values = solve_values()
+    solve_seconds = time.perf_counter() - start
+    result = evaluate_model(model, values)
+
+    print(
+        f"{result['positions']} O-to-move positions; solved in {solve_seconds * 1e3:.1f} ms, "
+        f"predicted in {result['predict_seconds'] * 1e3:.1f} ms"
+    )
+    print(f"  optimal-move agreement: {100 * result['agreement']:.2f}%")
+    print(f"  illegal predictions:    {100 * result['illegal_rate']:.2f}% (first-free-cell fallback)")
+    print(
+        f"  blunders:               {100 * result['blunder_rate']:.2f}% "
+        f"({result['blunders']} of {result['drawn_positions']} drawn positions lost)"
+    )
+    print(f"  missed wins:            {result['missed_wins']} of {result['won_positions']} won positions")
+    print(f"{'marks':>5} {'positions':>9} {'agree':>7} {'illegal':>7} {'blunders':>8}")
+    for n, row in result["by_marks"].items():
+        print(
+            f"{n:>5} {row['positions']:>9} {100 * row['agreement']:>6.1f}% "
+            f"{100 * row['illegal']:>6.1f}% {row['blunders']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
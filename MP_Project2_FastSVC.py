@@ -0,0 +1,132 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Pure NumPy SVC inference
+Overview:
+    A fitted scikit-learn SVC (linear or rbf kernel, as chosen by the
+    grid search in Part C) is exported to plain arrays: support vectors,
+    dual coefficients, intercepts, gamma and class labels. NumpySVC
+    rebuilds predict() and decision_function() from those arrays for whole
+    batches of boards, without sklearn's per-call input validation and
+    without importing sklearn at all.
+
+    predict() follows libsvm's one-vs-one voting (ties go to the lower
+    class index) and decision_function() reproduces the "ovr" shape that
+    SVC(decision_function_shape="ovr") returns.
+-----------------------------------------------------------------------------
+"""
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+EXPORT_FILE = "svc_export.npz"
+
+
+def export_svc(model, path: Optional[str] = EXPORT_FILE, key: str = "") -> Dict[str, np.ndarray]:
+    """
+    Pull the raw arrays out of a fitted SVC. If path is given they are also
+    saved there (np.savez), together with an optional cache key; the file is
+    replaced atomically, so an interrupted export never leaves a broken one.
+    """
+    if model.kernel not in ("linear", "rbf"):
+        raise ValueError(f"unsupported kernel: {model.kernel}")
+    arrays = {
+        "support_vectors": np.asarray(model.support_vectors_, dtype=np.float64),
+        "dual_coef": np.asarray(model._dual_coef_, dtype=np.float64),
+        "intercept": np.asarray(model._intercept_, dtype=np.float64),
+        "n_support": np.asarray(model.n_support_, dtype=np.int64),
+        "classes": np.asarray(model.classes_),
+        "gamma": np.array(model._gamma, dtype=np.float64),
+        "kernel": np.array(model.kernel),
+        "key": np.array(key),
+    }
+    if path is not None:
+        # Through a file object, so np.savez does not append ".npz" to the temp name
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    return arrays
+
+
+class NumpySVC:
+    """
+    Batch predict/decision_function for an exported SVC.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.support_vectors = arrays["support_vectors"]
+        self.dual_coef = arrays["dual_coef"]
+        self.intercept = arrays["intercept"]
+        self.classes = arrays["classes"]
+        self.gamma = float(arrays["gamma"])
+        self.kernel = str(arrays["kernel"])
+        self.key = str(arrays["key"]) if "key" in arrays else ""
+
+        # Fold the one-vs-one pairs into matrices so a batch needs only a few matmuls:
+        # column p of pair_coef holds the coefficients of pair p over all support vectors,
+        # and pair_i / pair_j one-hot encode which two classes the pair compares
+        n_support = arrays["n_support"]
+        self.n_classes = len(self.classes)
+        starts = np.concatenate([[0], np.cumsum(n_support)])
+        pairs = [(i, j) for i in range(self.n_classes) for j in range(i + 1, self.n_classes)]
+        self.pair_coef = np.zeros((len(self.support_vectors), len(pairs)))
+        self.pair_i = np.zeros((len(pairs), self.n_classes))
+        self.pair_j = np.zeros((len(pairs), self.n_classes))
+        for p, (i, j) in enumerate(pairs):
+            # SVs of class i use coefficient row j-1, SVs of class j use row i
+            self.pair_coef[starts[i]:starts[i + 1], p] = self.dual_coef[j - 1, starts[i]:starts[i + 1]]
+            self.pair_coef[starts[j]:starts[j + 1], p] = self.dual_coef[i, starts[j]:starts[j + 1]]
+            self.pair_i[p, i] = 1
+            self.pair_j[p, j] = 1
+        self.sv_sq_norms = (self.support_vectors ** 2).sum(axis=1)
+
+    @classmethod
+    def from_model(cls, model) -> "NumpySVC":
+        return cls(export_svc(model, path=None))
+
+    @classmethod
+    def load(cls, path: str = EXPORT_FILE) -> "NumpySVC":
+        with np.load(path) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def _kernel(self, X: np.ndarray) -> np.ndarray:
+        """
+        (N, n_SV) kernel matrix between the inputs and the support vectors.
+        """
+        dots = X @ self.support_vectors.T
+        if self.kernel == "linear":
+            return dots
+        sq_dist = (X ** 2).sum(axis=1)[:, None] + self.sv_sq_norms[None, :] - 2.0 * dots
+        np.maximum(sq_dist, 0.0, out=sq_dist)
+        return np.exp(-self.gamma * sq_dist)
+
+    def _ovo_decision(self, X: np.ndarray) -> np.ndarray:
+        """
+        (N, n_pairs) libsvm one-vs-one decision values, pairs ordered (0,1), (0,2), ...
+        """
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.support_vectors.shape[1])
+        return self._kernel(X) @ self.pair_coef + self.intercept
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Class labels for a batch of feature rows, by one-vs-one voting.
+        """
+        positive = self._ovo_decision(X) > 0
+        votes = positive @ self.pair_i + (~positive) @ self.pair_j
+        return self.classes[votes.argmax(axis=1)]
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        """
+        (N, n_classes) scores matching SVC(decision_function_shape="ovr").
+        """
+        dec = self._ovo_decision(X)
+        if self.n_classes == 2:
+            return -dec[:, 0]
+        wins = dec >= 0
+        votes = wins @ self.pair_i + (~wins) @ self.pair_j
+        confidence = dec @ self.pair_i - dec @ self.pair_j
+        return votes + confidence / (3 * (np.abs(confidence) + 1))
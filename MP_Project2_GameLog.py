@@ -0,0 +1,220 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Binary game-record log
+Overview:
+    An append-only log of finished games, a few bytes per game:
+        file header  <4sHB   magic b"TTTG", version, board size
+        per game     <BBI    info    = move count | result << 5
+                             players = X player code | O player code << 4
+                             timestamp (unix seconds)
+                     then the moves as 4-bit cell indices, two per byte
+                     (first move in the low nibble)
+    A full 3x3 game takes 11 bytes. Results are 0=X, 1=O, 2=draw and the
+    player codes index PLAYERS. Cell indices are row * size + col, so
+    boards up to 4x4 fit.
+
+    GameLogWriter appends through a buffered file and is used by the
+    play() loops (--game-log), the headless self-play runner and the
+    game server. read_games() is a generator that parses the file in
+    fixed-size chunks, so logs of any size can be scanned without
+    loading them into memory; a record cut short by a crash is skipped,
+    and GameLogWriter trims it off before appending so later records
+    stay aligned. A record with an unknown result or player code raises
+    ValueError.
+
+    Example:
+        python MP_Project2_SelfPlay.py --games 10000 --game-log games.log
+        python MP_Project2_GameLog.py games.log
+-----------------------------------------------------------------------------
+"""
+import argparse
+import os
+import struct
+import time
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+GAME_LOG_FILE = "tictac_games.log"
+GAME_LOG_MAGIC = b"TTTG"
+GAME_LOG_VERSION = 1
+HEADER = struct.Struct("<4sHB")
+RECORD = struct.Struct("<BBI")
+
+RESULTS = ("X", "O", "draw")
+PLAYERS = ("human", "minimax", "svc", "random", "script", "mcts")
+
+# Largest board whose cell indices fit in the 4-bit move encoding
+MAX_SIZE = 4
+
+
+class GameRecord(NamedTuple):
+    moves: Tuple[int, ...]
+    result: str
+    x_player: str
+    o_player: str
+    timestamp: int
+
+
+def pack_game(
+    moves: Sequence[int], result: str, x_player: str, o_player: str, timestamp: Optional[int] = None
+) -> bytes:
+    """
+    Encode one finished game as a log record.
+    """
+    if len(moves) > 16 or any(not 0 <= m < 16 for m in moves):
+        raise ValueError("moves must be at most 16 cell indices below 16")
+    if timestamp is None:
+        timestamp = int(time.time())
+    info = len(moves) | RESULTS.index(result) << 5
+    players = PLAYERS.index(x_player) | PLAYERS.index(o_player) << 4
+    packed = bytearray((len(moves) + 1) // 2)
+    for i, move in enumerate(moves):
+        packed[i // 2] |= move << (4 * (i % 2))
+    return RECORD.pack(info, players, timestamp) + bytes(packed)
+
+
+class GameLogWriter:
+    """
+    Buffered appender for the game log. Records reach the disk when the
+    buffer fills and on flush()/close().
+    """
+
+    def __init__(self, path: str = GAME_LOG_FILE, size: int = 3, buffer_size: int = 1 << 16):
+        if not 1 <= size <= MAX_SIZE:
+            raise ValueError(f"game logs hold boards up to {MAX_SIZE}x{MAX_SIZE}, got {size}x{size}")
+        self.path = path
+        self.size = size
+        self.games = 0
+        existing = os.path.getsize(path) if os.path.exists(path) else 0
+        if existing:
+            with open(path, "r+b") as f:
+                header = f.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    raise ValueError(f"{path} is not a {size}x{size} game log")
+                magic, version, log_size = HEADER.unpack(header)
+                if magic != GAME_LOG_MAGIC or version != GAME_LOG_VERSION or log_size != size:
+                    raise ValueError(f"{path} is not a {size}x{size} game log")
+                # A crash can leave a torn record at the end; appending after it
+                # would misalign every later record, so cut it off first
+                end = HEADER.size
+                for end, _ in _scan(f):
+                    pass
+                if end < existing:
+                    f.truncate(end)
+        self.file = open(path, "ab", buffering=buffer_size)
+        if not existing:
+            self.file.write(HEADER.pack(GAME_LOG_MAGIC, GAME_LOG_VERSION, size))
+
+    def record(
+        self,
+        moves: Sequence[Tuple[int, int]],
+        result: str,
+        x_player: str,
+        o_player: str,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Append one game given its (row, col) moves in order.
+        """
+        cells = [r * self.size + c for r, c in moves]
+        self.file.write(pack_game(cells, result, x_player, o_player, timestamp))
+        self.games += 1
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self) -> "GameLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _scan(f: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[Tuple[int, GameRecord]]:
+    """
+    (end offset, game) for every complete record after the header of the open log f.
+    """
+    f.seek(HEADER.size)
+    offset = HEADER.size
+    buf = b""
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            return
+        buf += data
+        pos = 0
+        while pos + RECORD.size <= len(buf):
+            info, players, timestamp = RECORD.unpack_from(buf, pos)
+            n_moves = info & 0x1F
+            result, x_code, o_code = info >> 5, players & 0xF, players >> 4
+            if n_moves > 16 or result >= len(RESULTS) or x_code >= len(PLAYERS) or o_code >= len(PLAYERS):
+                raise ValueError(f"{f.name}: corrupt game record at byte {offset + pos}")
+            end = pos + RECORD.size + (n_moves + 1) // 2
+            if end > len(buf):
+                break
+            packed = buf[pos + RECORD.size:end]
+            moves = tuple((packed[i // 2] >> (4 * (i % 2))) & 0xF for i in range(n_moves))
+            yield offset + end, GameRecord(moves, RESULTS[result], PLAYERS[x_code], PLAYERS[o_code], timestamp)
+            pos = end
+        buf = buf[pos:]
+        offset += pos
+
+
+def read_games(path: str = GAME_LOG_FILE, chunk_size: int = 1 << 20) -> Iterator[GameRecord]:
+    """
+    Yield every complete game in the log, reading chunk_size bytes at a time.
+    """
+    with open(path, "rb") as f:
+        magic, version, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != GAME_LOG_MAGIC or version != GAME_LOG_VERSION:
+            raise ValueError(f"{path} is not a game log")
+        for _, game in _scan(f, chunk_size):
+            yield game
+
+
+def summarize(path: str = GAME_LOG_FILE) -> Dict[Tuple[str, str], Dict[str, int]]:
+    """
+    Result counts per (X player, O player) pairing, streamed from the log.
+    """
+    summary: Dict[Tuple[str, str], Dict[str, int]] = {}
+    for game in read_games(path):
+        counts = summary.setdefault((game.x_player, game.o_player), {"X": 0, "O": 0, "draw": 0, "moves": 0})
+        counts[game.result] += 1
+        counts["moves"] += len(game.moves)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a binary Tic-Tac-Toe game log.")
+    parser.add_argument("path", nargs="?", default=GAME_LOG_FILE)
+    parser.add_argument("--show", type=int, default=0, help="also print the first N games")
+    args = parser.parse_args()
+
+    if args.show:
+        shown: List[GameRecord] = []
+        for game in read_games(args.path):
+            shown.append(game)
+            if len(shown) == args.show:
+                break
+        for game in shown:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(game.timestamp))
+            moves = " ".join(str(m) for m in game.moves)
+            print(f"{stamp}  {game.x_player} vs {game.o_player}: {game.result:<4}  moves {moves}")
+
+    for (x_player, o_player), counts in summarize(args.path).items():
+        games = counts["X"] + counts["O"] + counts["draw"]
+        print(
+            f"{x_player} (X) vs {o_player} (O): {games} games, "
+            f"X {counts['X']}, O {counts['O']}, draw {counts['draw']}, "
+            f"{counts['moves'] / games:.2f} moves/game"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Optimal-move dataset generator
+Overview:
+    Regenerates the tictac datasets from the Part B engine instead of
+    relying on an external file. Every reachable position where O is to
+    move is labelled with
+        single - the move get_best_move would play with the same --search,
+                 ties included (tictac_single layout)
+        multi  - a 0/1 flag per cell for every optimal move (tictac_multi layout)
+    Rows are the board cells (X=1, O=-1, empty=0) followed by the label
+    column(s), space separated, so np.loadtxt / load_dataset read them
+    directly. --augment adds the rotated/reflected copies of each board
+    with their labels mapped along. Labelling is sharded over a process
+    pool; --max-marks limits the enumeration for larger boards.
+
+    Example:
+        python MP_Project2_Generate.py --output tictac_single.txt
+        python MP_Project2_Generate.py --labels multi --output tictac_multi.txt
+        python MP_Project2_Generate.py --size 4 --search alphabeta --depth 4 --max-marks 4
+-----------------------------------------------------------------------------
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from MP_Project2_PartB import TicTacToe, symmetries, winning_lines
+
+Position = Tuple[str, ...]
+
+# One engine per pool worker, keyed by (size, win_length, search)
+_ENGINES: Dict[tuple, TicTacToe] = {}
+
+
+def reachable_o_positions(size: int, win_length: int, max_marks: Optional[int] = None) -> List[Position]:
+    """
+    Flat boards (row-major) of every reachable, unfinished position with O to move.
+    max_marks stops the enumeration after that many marks are on the board.
+    """
+    cells = size * size
+    lines = [[r * size + c for r, c in line] for line in winning_lines(size, win_length)]
+    limit = cells if max_marks is None else max_marks
+
+    found: List[Position] = []
+    seen: Set[Position] = set()
+    stack: List[Position] = [tuple(" " * cells)]
+    while stack:
+        pos = stack.pop()
+        if pos in seen:
+            continue
+        seen.add(pos)
+        if any(pos[line[0]] != " " and all(pos[i] == pos[line[0]] for i in line) for line in lines):
+            continue
+        marks = cells - pos.count(" ")
+        if marks == cells:
+            continue
+        turn = "X" if marks % 2 == 0 else "O"
+        if turn == "O":
+            found.append(pos)
+        if marks >= limit:
+            continue
+        for i in range(cells):
+            if pos[i] == " ":
+                stack.append(pos[:i] + (turn,) + pos[i + 1:])
+    found.sort()
+    return found
+
+
+def _label_chunk(spec: tuple, positions: List[Position]) -> List[Tuple[int, List[int]]]:
+    """
+    Pool task: (best move index, 0/1 optimal flags per cell) for each position.
+    """
+    size, win_length, search, depth = spec
+    engine = _ENGINES.get(spec[:3])
+    if engine is None:
+        engine = TicTacToe(search=search, size=size, win_length=win_length)
+        _ENGINES[spec[:3]] = engine
+
+    results = []
+    for pos in positions:
+        board = [list(pos[r * size:(r + 1) * size]) for r in range(size)]
+        if search == "alphabeta":
+            # Alpha-beta tries the root moves center, corners, edges (engine.move_order)
+            free = [(r, c) for r, c in engine.move_order if board[r][c] == " "]
+        else:
+            free = [(r, c) for r in range(size) for c in range(size) if board[r][c] == " "]
+        remaining = len(free) if depth is None else min(depth, len(free))
+        scores = []
+        for r, c in free:
+            child = [row[:] for row in board]
+            scores.append(engine._scoreRootMove(child, (r, c), remaining, None))
+
+        # First best in the order the search tries moves (row-major for minimax,
+        # move_order for alpha-beta), the same tie-break get_best_move uses
+        best_score = max(scores)
+        best = free[scores.index(best_score)]
+        flags = [0] * (size * size)
+        for (r, c), score in zip(free, scores):
+            if score == best_score:
+                flags[r * size + c] = 1
+        results.append((best[0] * size + best[1], flags))
+    return results
+
+
+def label_positions(
+    positions: List[Position],
+    size: int,
+    win_length: int,
+    search: str = "minimax",
+    depth: Optional[int] = None,
+    workers: int = 1,
+) -> List[Tuple[int, List[int]]]:
+    """
+    Label every position, sharding the work over 'workers' processes.
+    """
+    spec = (size, win_length, search, depth)
+    if workers <= 1:
+        return _label_chunk(spec, positions)
+
+    chunk_size = max(1, len(positions) // (workers * 8))
+    chunks = [positions[i:i + chunk_size] for i in range(0, len(positions), chunk_size)]
+    results: List[Tuple[int, List[int]]] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_label_chunk, [spec] * len(chunks), chunks):
+            results.extend(part)
+    return results
+
+
+def augment(
+    positions: List[Position], labels: List[Tuple[int, List[int]]], size: int
+) -> Tuple[List[Position], List[Tuple[int, List[int]]]]:
+    """
+    Add the distinct rotations/reflections of each board, with labels mapped the same way.
+    """
+    perms = symmetries(size)
+    out_positions: List[Position] = []
+    out_labels: List[Tuple[int, List[int]]] = []
+    for pos, (best, flags) in zip(positions, labels):
+        images: Set[Position] = set()
+        for perm in perms:
+            # perm maps a source cell to its destination cell
+            image = [" "] * len(pos)
+            image_flags = [0] * len(pos)
+            for src, dest in enumerate(perm):
+                image[dest] = pos[src]
+                image_flags[dest] = flags[src]
+            image_pos = tuple(image)
+            if image_pos in images:
+                continue
+            images.add(image_pos)
+            out_positions.append(image_pos)
+            out_labels.append((perm[best], image_flags))
+    return out_positions, out_labels
+
+
+def write_dataset(path: str, positions: List[Position], labels: List[Tuple[int, List[int]]], multi: bool) -> None:
+    """
+    Write rows of board cells (X=1, O=-1, empty=0) followed by the label column(s).
+    """
+    mapping = {"X": "1", "O": "-1", " ": "0"}
+    with open(path, "w") as f:
+        for pos, (best, flags) in zip(positions, labels):
+            cells = " ".join(mapping[cell] for cell in pos)
+            if multi:
+                f.write(cells + " " + " ".join(str(v) for v in flags) + "\n")
+            else:
+                f.write(f"{cells} {best}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate optimal-move datasets with the minimax engine.")
+    parser.add_argument("--output", default="tictac_generated.txt")
+    parser.add_argument("--labels", choices=["single", "multi"], default="single")
+    parser.add_argument("--augment", action="store_true", help="add rotated/reflected copies")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--search", choices=["minimax", "alphabeta"], default="minimax")
+    parser.add_argument("--depth", type=int, default=None, help="alpha-beta depth limit (default: full game)")
+    parser.add_argument("--max-marks", type=int, default=None, help="only enumerate positions up to this many marks")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    win_length = args.win_length if args.win_length is not None else args.size
+    positions = reachable_o_positions(args.size, win_length, args.max_marks)
+    labels = label_positions(positions, args.size, win_length, args.search, args.depth, args.workers)
+    if args.augment:
+        positions, labels = augment(positions, labels, args.size)
+    write_dataset(args.output, positions, labels, args.labels == "multi")
+    print(f"Wrote {len(positions)} positions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Incremental line counters
+Overview:
+    Instead of rescanning every line after each move, LineCounter keeps
+    how many X and O marks sit on each winning line, how many lines each
+    player has completed, and how many moves have been made. Applying or
+    undoing a move only touches the lines through that cell, so "has X
+    won?" and "is the board full?" are constant-time lookups. It also
+    keeps the empty cells as a bitmask, so listing the legal moves
+    touches only the empty cells instead of reading the whole board.
+    The Part B searches make and unmake moves with apply()/undo(), which
+    write the working board and update the counts together; the games
+    themselves keep a Position (MP_Project2_Position).
+-----------------------------------------------------------------------------
+"""
+from typing import List, Optional, Tuple
+
+
+def winning_lines(size: int, win_length: int) -> List[List[Tuple[int, int]]]:
+    """
+    Every run of win_length cells along a row, column or diagonal of a size x size board.
+    """
+    lines = []
+    for r in range(size):
+        for c in range(size):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_r = r + dr * (win_length - 1)
+                end_c = c + dc * (win_length - 1)
+                if 0 <= end_r < size and 0 <= end_c < size:
+                    lines.append([(r + dr * i, c + dc * i) for i in range(win_length)])
+    return lines
+
+
+class LineCounter:
+    """
+    Per-line mark counts for one board, updated one move at a time.
+    """
+
+    __slots__ = ("size", "win_length", "cells", "cell_lines", "counts", "wins", "moves", "empty")
+
+    def __init__(self, size: int = 3, win_length: Optional[int] = None):
+        self.size = size
+        self.win_length = win_length if win_length is not None else size
+        self.cells = size * size
+
+        # cell_lines[r][c] lists the indices of the lines through (r, c)
+        lines = winning_lines(size, self.win_length)
+        self.cell_lines: List[List[List[int]]] = [[[] for _ in range(size)] for _ in range(size)]
+        for idx, line in enumerate(lines):
+            for r, c in line:
+                self.cell_lines[r][c].append(idx)
+
+        self.counts = {"X": [0] * len(lines), "O": [0] * len(lines)}
+        self.wins = {"X": 0, "O": 0}
+        self.moves = 0
+
+        # Bit r * size + c is set while (r, c) is empty
+        self.empty = (1 << self.cells) - 1
+
+    @classmethod
+    def from_board(cls, board, win_length: Optional[int] = None) -> "LineCounter":
+        """
+        Counter for an existing board (nested lists or BitBoard).
+        """
+        size = len(board)
+        counter = cls(size, win_length)
+        for r in range(size):
+            for c in range(size):
+                mark = board[r][c]
+                if mark != " ":
+                    counter.add(r, c, mark)
+        return counter
+
+    def reset(self) -> None:
+        for mark in ("X", "O"):
+            counts = self.counts[mark]
+            for idx in range(len(counts)):
+                counts[idx] = 0
+            self.wins[mark] = 0
+        self.moves = 0
+        self.empty = (1 << self.cells) - 1
+
+    def add(self, r: int, c: int, mark: str) -> None:
+        """
+        Record 'mark' being placed on (r, c).
+        """
+        counts = self.counts[mark]
+        for idx in self.cell_lines[r][c]:
+            counts[idx] += 1
+            if counts[idx] == self.win_length:
+                self.wins[mark] += 1
+        self.moves += 1
+        self.empty &= ~(1 << (r * self.size + c))
+
+    def remove(self, r: int, c: int, mark: str) -> None:
+        """
+        Undo add(r, c, mark).
+        """
+        counts = self.counts[mark]
+        for idx in self.cell_lines[r][c]:
+            if counts[idx] == self.win_length:
+                self.wins[mark] -= 1
+            counts[idx] -= 1
+        self.moves -= 1
+        self.empty |= 1 << (r * self.size + c)
+
+    def apply(self, board, r: int, c: int, mark: str) -> None:
+        """
+        Place 'mark' on board[r][c] and record it, keeping the board and counts in step.
+        """
+        board[r][c] = mark
+        self.add(r, c, mark)
+
+    def undo(self, board, r: int, c: int, mark: str) -> None:
+        """
+        Take back apply(board, r, c, mark).
+        """
+        self.remove(r, c, mark)
+        board[r][c] = " "
+
+    def empty_cells(self) -> List[Tuple[int, int]]:
+        """
+        Empty cells in row-major order, read from the bitmask.
+        """
+        cells = []
+        empty = self.empty
+        while empty:
+            low = empty & -empty
+            cells.append(divmod(low.bit_length() - 1, self.size))
+            empty ^= low
+        return cells
+
+    def has_won(self, mark: str) -> bool:
+        return self.wins[mark] > 0
+
+    def is_full(self) -> bool:
+        return self.moves == self.cells
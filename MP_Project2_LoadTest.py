@@ -0,0 +1,142 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Game server load test
+Overview:
+    Opens many concurrent sessions against MP_Project2_Server and plays
+    random legal X moves until every session has finished its games.
+    Reports games/sec, moves/sec and the round-trip latency of each move
+    (from sending "row,col" until the server is waiting for X again or
+    the game is over) as p50/p90/p99.
+
+    Example:
+        python MP_Project2_Server.py --port 8765 &
+        python MP_Project2_LoadTest.py --port 8765 --sessions 500 --games 10
+-----------------------------------------------------------------------------
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+from MP_Project2_Bench import percentile
+
+
+async def _readUntil(reader: asyncio.StreamReader, prefixes) -> List[str]:
+    """
+    Read server lines up to and including the first one starting with any of 'prefixes'.
+    """
+    lines = []
+    while True:
+        raw = await reader.readline()
+        if not raw:
+            raise ConnectionError("server closed the connection")
+        line = raw.decode().strip()
+        lines.append(line)
+        if line.startswith(prefixes):
+            return lines
+
+
+async def run_session(
+    host: str, port: int, games: int, opponent: str, rng: random.Random, latencies: List[float], results: Dict[str, int]
+) -> int:
+    """
+    Play 'games' games on one connection; returns the number of X moves sent.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    moves = 0
+    try:
+        await _readUntil(reader, ("HELLO",))
+        for _ in range(games):
+            writer.write(f"NEW {opponent}\n".encode())
+            lines = await _readUntil(reader, ("TURN", "ERROR"))
+            if lines[-1].startswith("ERROR"):
+                raise RuntimeError(lines[-1])
+            board = lines[0].split()[1]
+            while True:
+                free = [i for i, cell in enumerate(board) if cell == "."]
+                r, c = divmod(rng.choice(free), 3)
+                start = time.perf_counter()
+                writer.write(f"{r},{c}\n".encode())
+                lines = await _readUntil(reader, ("TURN", "RESULT", "ERROR"))
+                latencies.append(time.perf_counter() - start)
+                moves += 1
+                last = lines[-1]
+                if last.startswith("ERROR"):
+                    raise RuntimeError(last)
+                board = next(line for line in lines if line.startswith("BOARD")).split()[1]
+                if last.startswith("RESULT"):
+                    outcome = last.split()[1]
+                    results[outcome] = results.get(outcome, 0) + 1
+                    break
+        writer.write(b"QUIT\n")
+        await writer.drain()
+    finally:
+        writer.close()
+    return moves
+
+
+def _latency_ms(latencies: List[float], pct: float) -> float:
+    """
+    Latency percentile in ms; NaN when no move completed.
+    """
+    return percentile(latencies, pct) * 1e3 if latencies else float("nan")
+
+
+async def load_test(host: str, port: int, sessions: int, games: int, opponent: str, seed: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    results: Dict[str, int] = {}
+    start = time.perf_counter()
+    counts = await asyncio.gather(
+        *(
+            run_session(host, port, games, opponent, random.Random(seed + i), latencies, results)
+            for i in range(sessions)
+        ),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    # A refused connection or protocol error ends that session only
+    errors = [c for c in counts if isinstance(c, BaseException)]
+    moves = sum(c for c in counts if not isinstance(c, BaseException))
+    total_games = sum(results.values())
+    return {
+        "sessions": sessions,
+        "failed_sessions": len(errors),
+        "first_error": repr(errors[0]) if errors else "",
+        "games": total_games,
+        "moves": moves,
+        "seconds": elapsed,
+        "games_per_sec": total_games / elapsed,
+        "moves_per_sec": moves / elapsed,
+        "p50_ms": _latency_ms(latencies, 50),
+        "p90_ms": _latency_ms(latencies, 90),
+        "p99_ms": _latency_ms(latencies, 99),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Tic-Tac-Toe game server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=100, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=10, help="games per session")
+    parser.add_argument("--opponent", choices=["minimax", "svc"], default="minimax")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stats = asyncio.run(load_test(args.host, args.port, args.sessions, args.games, args.opponent, args.seed))
+    print(f"{stats['sessions']} sessions, {stats['games']} games, {stats['moves']} moves in {stats['seconds']:.2f}s")
+    if stats["failed_sessions"]:
+        print(f"  {stats['failed_sessions']} sessions failed, first: {stats['first_error']}")
+    print(f"  {stats['games_per_sec']:.1f} games/sec, {stats['moves_per_sec']:.1f} moves/sec")
+    print(f"  move latency p50 {stats['p50_ms']:.2f} ms, p90 {stats['p90_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    for outcome in ("X", "O", "DRAW"):
+        print(f"  {outcome:>4}: {stats['results'].get(outcome, 0)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Monte Carlo tree search
+Overview:
+    A UCT player for boards where exact search does not finish in time
+    (e.g. --size 5 --win-length 4). Each iteration walks down the tree
+    by the UCT rule, expands the leaf, plays 'batch' random games from
+    it and backs the summed result up the path, so the descent and the
+    leaf setup are paid once per batch instead of once per playout.
+
+    The tree lives in parallel arrays (array module) indexed by node
+    number instead of one Python object per node:
+        parent, first, count   tree links; children are stored contiguously
+        move                   cell index played to reach the node
+        status                 -1 unknown, 0 open, 1 mover won, 2 draw
+        visits, value          playouts through the node and their summed
+                               result for the player who made 'move'
+    which is 25 bytes per node. After every search the tree is kept;
+    the next search() walks down the moves played since then and keeps
+    only that subtree (copied into fresh arrays so it stays compact).
+
+    Used by TicTacToe(search="mcts") in Part B and by the "mcts"
+    self-play agent. Run this file to measure playouts/sec and memory:
+        python MP_Project2_MCTS.py --size 5 --win-length 4 --playouts 20000
+-----------------------------------------------------------------------------
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from MP_Project2_Lines import winning_lines
+
+# Cell and mark codes used inside the tree and the playouts
+EMPTY, X, O = 0, 1, 2
+CODES = {" ": EMPTY, "X": X, "O": O}
+
+# Playouts per search when neither a playout nor a time budget is given
+DEFAULT_PLAYOUTS = 10000
+
+# (name, typecode) of the per-node arrays
+NODE_FIELDS = (
+    ("parent", "i"),
+    ("first", "i"),
+    ("count", "H"),
+    ("move", "H"),
+    ("status", "b"),
+    ("visits", "i"),
+    ("value", "d"),
+)
+
+
+class MCTS:
+    """
+    UCT search over an array-backed tree that is reused between moves.
+    search() takes row-major cells (" ", "X", "O") and the mark to move.
+    """
+
+    def __init__(
+        self,
+        size: int = 3,
+        win_length: Optional[int] = None,
+        playouts: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        batch: int = 8,
+        exploration: float = 1.4,
+        seed: Optional[int] = None,
+    ):
+        self.size = size
+        self.win_length = win_length if win_length is not None else size
+        self.cells = size * size
+        if playouts is None and time_budget is None:
+            playouts = DEFAULT_PLAYOUTS
+        if playouts is not None and playouts < 1:
+            raise ValueError(f"playouts must be at least 1, got {playouts}")
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.batch = batch
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+
+        # Lines as cell indices, and the lines (by index) through each cell
+        self.lines = [[r * size + c for r, c in line] for line in winning_lines(size, self.win_length)]
+        self.cell_lines: List[List[int]] = [[] for _ in range(self.cells)]
+        for idx, line in enumerate(self.lines):
+            for cell in line:
+                self.cell_lines[cell].append(idx)
+
+        self.last: Dict[str, float] = {}
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Drop the tree; the next search starts from scratch.
+        """
+        self._newArrays()
+        self.root_cells: Optional[List[int]] = None
+        self.root_mover = EMPTY
+
+    def _newArrays(self) -> None:
+        for name, typecode in NODE_FIELDS:
+            setattr(self, name, array(typecode))
+
+    def _addNode(self, parent: int, move: int) -> int:
+        self.parent.append(parent)
+        self.first.append(-1)
+        self.count.append(0)
+        self.move.append(move)
+        self.status.append(-1)
+        self.visits.append(0)
+        self.value.append(0.0)
+        return len(self.visits) - 1
+
+    def nodes(self) -> int:
+        return len(self.visits)
+
+    @staticmethod
+    def bytes_per_node() -> int:
+        return sum(array(typecode).itemsize for _, typecode in NODE_FIELDS)
+
+    def tree_bytes(self) -> int:
+        """
+        Memory held by the node arrays, including their spare capacity.
+        """
+        return sum(sys.getsizeof(getattr(self, name)) for name, _ in NODE_FIELDS)
+
+    def _reuse(self, cells: List[int], mark: int) -> int:
+        """
+        Move the root to 'cells' if it follows from the current root by expanded
+        moves and re-pack that subtree; otherwise start a new tree. Returns the
+        number of nodes kept.
+        """
+        node = -1
+        if self.root_cells is not None:
+            played = {X: [], O: []}
+            for i in range(self.cells):
+                if cells[i] != self.root_cells[i]:
+                    if self.root_cells[i] != EMPTY:
+                        played = None
+                        break
+                    played[cells[i]].append(i)
+            if played is not None:
+                # Replay the new marks alternately, starting with the side that was to move at the root
+                side = 3 - self.root_mover
+                other = 3 - side
+                if len(played[side]) - len(played[other]) == (0 if side == mark else 1):
+                    node = 0
+                    order = [m for pair in zip(played[side], played[other]) for m in pair] + played[side][len(played[other]):]
+                    for cell in order:
+                        node = self._child(node, cell)
+                        if node < 0:
+                            break
+
+        if node < 0:
+            self._newArrays()
+            self._addNode(-1, 0)
+            self.root_cells = cells
+            self.root_mover = 3 - mark
+            return 0
+
+        self._repack(node)
+        self.root_cells = cells
+        self.root_mover = 3 - mark
+        return self.nodes()
+
+    def _child(self, node: int, cell: int) -> int:
+        first = self.first[node]
+        if first < 0:
+            return -1
+        for k in range(first, first + self.count[node]):
+            if self.move[k] == cell:
+                return k
+        return -1
+
+    def _repack(self, node: int) -> None:
+        """
+        Copy the subtree under 'node' into fresh arrays, breadth first, so
+        siblings stay contiguous and the rest of the old tree is freed.
+        """
+        old = {name: getattr(self, name) for name, _ in NODE_FIELDS}
+        self._newArrays()
+        self._addNode(-1, old["move"][node])
+        self.status[0] = old["status"][node]
+        self.visits[0] = old["visits"][node]
+        self.value[0] = old["value"][node]
+        queue = [node]
+        head = 0
+        while head < len(queue):
+            src = queue[head]
+            first = old["first"][src]
+            if first >= 0:
+                self.first[head] = self.nodes()
+                self.count[head] = old["count"][src]
+                for k in range(first, first + old["count"][src]):
+                    new = self._addNode(head, old["move"][k])
+                    self.status[new] = old["status"][k]
+                    self.visits[new] = old["visits"][k]
+                    self.value[new] = old["value"][k]
+                    queue.append(k)
+            head += 1
+
+    def _expand(self, node: int, cells: List[int], empty: int) -> int:
+        """
+        Add a child of 'node' for every empty cell; returns the first child.
+        """
+        first = self.nodes()
+        self.first[node] = first
+        self.count[node] = empty
+        for cell in range(self.cells):
+            if cells[cell] == EMPTY:
+                self._addNode(node, cell)
+        return first
+
+    def _status(self, node: int, cells: List[int], mover: int, empty: int) -> int:
+        status = self.status[node]
+        if status < 0:
+            status = 0
+            if node != 0:
+                for idx in self.cell_lines[self.move[node]]:
+                    if all(cells[cell] == mover for cell in self.lines[idx]):
+                        status = 1
+                        break
+            if status == 0 and empty == 0:
+                status = 2
+            self.status[node] = status
+        return status
+
+    def _playouts(self, cells: List[int], to_move: int, n: int) -> int:
+        """
+        Play n random games from 'cells'; returns X wins minus O wins.
+        """
+        k = self.win_length
+        cell_lines = self.cell_lines
+        base = {X: [0] * len(self.lines), O: [0] * len(self.lines)}
+        for idx, line in enumerate(self.lines):
+            for cell in line:
+                if cells[cell] != EMPTY:
+                    base[cells[cell]][idx] += 1
+        free = [i for i in range(self.cells) if cells[i] == EMPTY]
+        shuffle = self.rng.shuffle
+
+        score = 0
+        for _ in range(n):
+            order = free[:]
+            shuffle(order)
+            counts = {X: base[X][:], O: base[O][:]}
+            mark = to_move
+            for cell in order:
+                own = counts[mark]
+                won = False
+                for idx in cell_lines[cell]:
+                    own[idx] += 1
+                    if own[idx] == k:
+                        won = True
+                if won:
+                    score += 1 if mark == X else -1
+                    break
+                mark = 3 - mark
+        return score
+
+    def search(self, cells: Sequence[str], mark: str = "O", cancel=None) -> Tuple[int, int]:
+        """
+        Best (row, col) for 'mark' on the row-major 'cells'. 'cancel' is an
+        optional threading.Event that ends the search early.
+        """
+        state = [CODES[cell] for cell in cells]
+        me = CODES[mark]
+        reused = self._reuse(state, me)
+        root_empty = state.count(EMPTY)
+        if root_empty == 0:
+            raise ValueError("no legal moves")
+        # An expanded root always has a move to return, even if no playout runs
+        if self.first[0] < 0:
+            self._expand(0, state, root_empty)
+
+        c = self.exploration
+        batch = self.batch
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        start = time.perf_counter()
+        done = 0
+        max_depth = 0
+
+        while True:
+            if self.playouts is not None and done >= self.playouts:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if cancel is not None and cancel.is_set():
+                break
+
+            # Selection: follow UCT while the node has been expanded
+            cells_now = state[:]
+            node = 0
+            mover = self.root_mover
+            empty = root_empty
+            path = [0]
+            while self.first[node] >= 0:
+                first = self.first[node]
+                # The root is expanded before its first visit; unvisited children go first anyway
+                log_n = math.log(max(self.visits[node], 1))
+                best = first
+                best_score = -math.inf
+                for k in range(first, first + self.count[node]):
+                    n = self.visits[k]
+                    if n == 0:
+                        best = k
+                        break
+                    score = self.value[k] / n + c * math.sqrt(log_n / n)
+                    if score > best_score:
+                        best_score = score
+                        best = k
+                node = best
+                mover = 3 - mover
+                cells_now[self.move[node]] = mover
+                empty -= 1
+                path.append(node)
+
+            # Expansion on the second visit, then one batch of playouts from the new node
+            status = self._status(node, cells_now, mover, empty)
+            if status == 0 and self.visits[node] > 0:
+                node = self._expand(node, cells_now, empty)
+                mover = 3 - mover
+                cells_now[self.move[node]] = mover
+                empty -= 1
+                path.append(node)
+                status = self._status(node, cells_now, mover, empty)
+
+            if status == 1:
+                score_x = batch if mover == X else -batch
+            elif status == 2:
+                score_x = 0
+            else:
+                score_x = self._playouts(cells_now, 3 - mover, batch)
+            done += batch
+            max_depth = max(max_depth, len(path) - 1)
+
+            # Backpropagation: each node keeps the result for the player who moved into it
+            reward = score_x if mover == X else -score_x
+            for k in reversed(path):
+                self.visits[k] += batch
+                self.value[k] += reward
+                reward = -reward
+
+        seconds = time.perf_counter() - start
+        first = self.first[0]
+        best = max(range(first, first + self.count[0]), key=lambda k: self.visits[k])
+        self.last = {
+            "playouts": done,
+            "seconds": seconds,
+            "playouts_per_sec": done / seconds if seconds else 0.0,
+            "nodes": self.nodes(),
+            "reused": reused,
+            "max_depth": max_depth,
+            "bytes_per_node": self.bytes_per_node(),
+            "tree_bytes": self.tree_bytes(),
+            "value": self.value[best] / self.visits[best] if self.visits[best] else 0.0,
+        }
+        return divmod(self.move[best], self.size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MCTS player by letting it play itself.")
+    parser.add_argument("--size", type=int, default=5)
+    parser.add_argument("--win-length", type=int, default=4)
+    parser.add_argument("--playouts", type=int, default=None, help="playouts per move")
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds per move")
+    parser.add_argument("--batch", type=int, default=8, help="playouts per leaf")
+    parser.add_argument("--moves", type=int, default=6, help="moves to play")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mcts = MCTS(args.size, args.win_length, args.playouts, args.time_budget, args.batch, seed=args.seed)
+    cells = [" "] * (args.size * args.size)
+    mark = "X"
+    total_playouts = 0
+    total_seconds = 0.0
+    for _ in range(min(args.moves, len(cells))):
+        r, c = mcts.search(cells, mark)
+        report = mcts.last
+        total_playouts += report["playouts"]
+        total_seconds += report["seconds"]
+        print(
+            f"{mark} {r},{c}: {report['playouts']} playouts, {report['playouts_per_sec']:.0f}/sec, "
+            f"{report['nodes']} nodes ({report['reused']} reused), depth {report['max_depth']}, "
+            f"value {report['value']:+.2f}"
+        )
+        cells[r * args.size + c] = mark
+        mark = "O" if mark == "X" else "X"
+
+    print(f"{total_playouts / total_seconds:.0f} playouts/sec overall")
+    print(
+        f"{mcts.bytes_per_node()} bytes per node in the arrays, "
+        f"{mcts.tree_bytes() / max(mcts.nodes(), 1):.1f} with spare capacity"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ Players enter moves as 'row,column'. The game validates input,
 checks for wins/draw, displays the board, and allows replay.
 """
 
+from MP_Project2_Position import Position
+
 
 # ---------------- Board Class ---------------- #
 
@@ -16,23 +18,34 @@ class Board:
     """Represents the 3x3 Tic-Tac-Toe board."""
 
     def __init__(self):
-        # I am initialising 3x3 space
-        self.c = [[" ", " ", " "],
-                [" ", " ", " "],
-                [" ", " ", " "]]
+        # I am initialising an empty 3x3 position (shared with Parts B and C);
+        # it is already two 9-bit masks, and c is a read-only board[r][c] view of it
+        self.position = Position.empty()
+
+    @property
+    def c(self):
+        """The grid as read-only rows; moves go through makeMove()."""
+        return self.position.grid()
+
+    def makeMove(self, row, col, mark):
+        """Place a mark: the board moves on to the child position."""
+        self.position = self.position.play(row, col, mark)
+
+    def unmakeMove(self, row, col):
+        """Take a mark back off the board."""
+        self.position = self.position.cleared(row, col)
 
     def reset(self):
         """Clearing the board for a new game."""
-        for r in range(3):
-            for col in range(3):
-                self.c[r][col] = " "
+        self.position = Position.empty()
 
     def printBoard(self):
         """This allows us to print the board with row/column labels."""
         header = "-----------------\n|R\\C| 0 | 1 | 2 |\n-----------------"
         print(header)
         for r in range(3):
-            print(f"| {r} | {self.c[r][0]} | {self.c[r][1]} | {self.c[r][2]} |")
+            row = self.position[r * 3:(r + 1) * 3]
+            print(f"| {r} | {row[0]} | {row[1]} | {row[2]} |")
             print("-----------------")
 
 
@@ -53,45 +66,17 @@ class Game:
         """
         This will allow us to validate
         """
-        if not (0 <= row <= 2 and 0 <= col <= 2):
-            return False
-        if self.board.c[row][col] != " ":
-            return False
-        return True
+        return self.board.position.is_legal(row, col)
 
     def checkFull(self):
         """Return True if the board is full; otherwise False."""
-        for r in range(3):
-            for c in range(3):
-                if self.board.c[r][c] == " ":
-                    return False
-        return True
+        return self.board.position.is_full()
 
     def checkWin(self):
         """
         Return True if the current player (self.turn) has a winning line.
-        Checks rows, columns, and diagonals.
         """
-        t = self.turn
-        b = self.board.c
-
-        # Rows
-        for r in range(3):
-            if b[r][0] == b[r][1] == b[r][2] == t:
-                return True
-
-        # Columns
-        for c in range(3):
-            if b[0][c] == b[1][c] == b[2][c] == t:
-                return True
-
-        # Diagonals
-        if b[0][0] == b[1][1] == b[2][2] == t:
-            return True
-        if b[0][2] == b[1][1] == b[2][0] == t:
-            return True
-
-        return False
+        return self.board.position.has_won(self.turn)
 
     def checkEnd(self):
 
@@ -136,7 +121,7 @@ class Game:
                 print("Invalid move. Out of range or cell already taken. Try again.")
                 continue
 
-            self.board.c[row][col] = self.turn
+            self.board.makeMove(row, col, self.turn)
 
 
             if self.checkEnd():
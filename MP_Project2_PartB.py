@@ -11,24 +11,335 @@ Overview:
     validates inputs, and checks for wins across rows/columns/diagonals
     or a draw on a full board. After each round it offers to start a new 
     game without restarting the program.
+    Larger N x N, k-in-a-row variants can be played with --size and
+    --win-length; --time-budget bounds the computer's thinking time.
+    --search mcts swaps the exact search for Monte Carlo tree search
+    (--playouts per move) on boards too big to search to the end.
 -----------------------------------------------------------------------------
 """
-from typing import List, Tuple
+import argparse
+import copy
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from MP_Project2_Bitboard import BitBoard
+from MP_Project2_GameLog import GameLogWriter
+from MP_Project2_Lines import LineCounter, winning_lines
+from MP_Project2_MCTS import MCTS
+from MP_Project2_Position import Position
+from MP_Project2_Solution import SolutionTable
+from MP_Project2_Stats import SearchStats, describe
 
 Board = List[List[str]]
 
+
+
+def cell_order(size: int, lines: List[List[Tuple[int, int]]]) -> List[Tuple[int, int]]:
+    """
+    Cells sorted by how many winning lines pass through them (ties stay row-major).
+    On 3x3 this is center first, then corners, then edges.
+    """
+    counts: Dict[Tuple[int, int], int] = {}
+    for line in lines:
+        for cell in line:
+            counts[cell] = counts.get(cell, 0) + 1
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    return sorted(cells, key=lambda m: -counts.get(m, 0))
+
+
+# All possible winning lines
+LINES = winning_lines(3, 3)
+
+# Heuristic move ordering: center first, then corners, then edges
+MOVE_ORDER = cell_order(3, LINES)
+
+# Alpha-beta scores are +/-(WIN_SCORE - marks on board), so faster wins score higher;
+# heuristic scores at a depth cutoff always stay well inside that range
+WIN_SCORE = 1000000
+
+# Bound flags for alpha-beta entries in the transposition table
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def symmetries(n: int) -> List[List[int]]:
+    """
+    Cell index permutations for the 8 rotations and reflections of an n x n board.
+    """
+    perms = []
+    for flip in (False, True):
+        for turns in range(4):
+            perm = []
+            for r in range(n):
+                for c in range(n):
+                    rr, cc = r, c
+                    for _ in range(turns):
+                        rr, cc = cc, n - 1 - rr
+                    if flip:
+                        cc = n - 1 - cc
+                    perm.append(rr * n + cc)
+            perms.append(perm)
+    return perms
+
+
+SYMMETRIES = symmetries(3)
+_SYMMETRY_CACHE = {3: SYMMETRIES}
+
+
+def canonical_key(board: Board) -> str:
+    """
+    Hash a board so that all 8 rotations/reflections map to the same key.
+    """
+    if isinstance(board, BitBoard):
+        return board.canonical()
+    n = len(board)
+    if n not in _SYMMETRY_CACHE:
+        _SYMMETRY_CACHE[n] = symmetries(n)
+    flat = [cell for row in board for cell in row]
+    return min("".join(flat[i] for i in perm) for perm in _SYMMETRY_CACHE[n])
+
+
+class _SearchTimeout(Exception):
+    """
+    Raised inside the search when the per-move time budget runs out.
+    """
+
+
+# Process pools by worker count, reused across moves and games
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+# Engines living inside each pool worker, keyed by (size, win_length, search)
+_WORKER_ENGINES: Dict[tuple, "TicTacToe"] = {}
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool with the given number of workers, starting it once.
+    """
+    if workers not in _POOLS:
+        _POOLS[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _POOLS[workers]
+
+
+def shutdown_pools() -> None:
+    """
+    Stop every shared process pool.
+    """
+    for pool in _POOLS.values():
+        pool.shutdown()
+    _POOLS.clear()
+
+
+def _score_root_move(
+    spec: tuple, board: Board, move: Tuple[int, int], depth: int, deadline: Optional[float]
+) -> Optional[int]:
+    """
+    Pool task: O's score for 'move' on the worker's own copy of board,
+    or None if the deadline passed first.
+    """
+    engine = _WORKER_ENGINES.get(spec)
+    if engine is None:
+        size, win_length, search = spec
+        engine = TicTacToe(search=search, size=size, win_length=win_length)
+        _WORKER_ENGINES[spec] = engine
+    return engine._scoreRootMove(board, move, depth, deadline)
+
+
+class TranspositionTable:
+    """
+    Bounded cache of solved positions keyed by canonical board hash.
+    Once max_size entries are stored, the least recently used one is evicted.
+    A lock guards every access, so one table can be shared by searches
+    running in several threads.
+    """
+
+    def __init__(self, max_size: int = 50000):
+        self.max_size = max_size
+        self.entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: tuple) -> Optional[object]:
+        """
+        Return the cached score for key, or None on a miss.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, score: object) -> None:
+        """
+        Store a score, evicting the oldest entry if the table is full.
+        """
+        if self.max_size <= 0:
+            return
+        with self.lock:
+            self.entries[key] = score
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters and current size.
+        """
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
 class TicTacToe:
-    def __init__(self):            # Initializing a 3x3 grid of spaces, looping row by row
-        self.board: Board = []
-        for _ in range(3):
-            row = []
-            for _ in range(3):
-                row.append(" ")
-            self.board.append(row)
+    # One table per process, so solved positions carry over between games and instances
+    shared_table = TranspositionTable()
+
+    def __init__(
+        self,
+        table: Optional[TranspositionTable] = None,
+        search: str = "alphabeta",
+        bitboard: bool = False,
+        solution: Optional[SolutionTable] = None,
+        size: int = 3,
+        win_length: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        workers: int = 1,
+        game_log: Optional[GameLogWriter] = None,
+        stats: Optional[SearchStats] = None,
+        ponder: bool = False,
+        playouts: Optional[int] = None,
+    ):
+        if bitboard and size != 3:
+            raise ValueError("bitboard storage only supports the 3x3 board")
+
+        # Board size and how many in a row win (defaults to the full row)
+        self.size = size
+        self.win_length = win_length if win_length is not None else size
+        if not 1 <= self.win_length <= size:
+            raise ValueError(f"win_length must be between 1 and {size}, got {self.win_length}")
+        self.cells = size * size
+        self.lines = winning_lines(size, self.win_length)
+        self.move_order = cell_order(size, self.lines)
+        self.move_rank = {m: i for i, m in enumerate(self.move_order)}
+
+        # The game state is an immutable Position (see MP_Project2_Position);
+        # self.board is a read-only board[r][c] view of it. The searches work
+        # on a mutable copy, a BitBoard when bitboard=True (see _searchBoard).
+        self.bitboard = bitboard
+        self.resetBoard()
 
         # Starting the first turn as X
         self.turn: str = "X"
-        self.sep = "." * 17
+        self.sep = "." * (5 + 4 * size)
+        self.table = table if table is not None else TicTacToe.shared_table
+
+        # Precomputed perfect-play table; None means always search live
+        self.solution = solution
+
+        # "alphabeta" (default), "minimax" for the original exhaustive search,
+        # or "mcts" for Monte Carlo tree search (see MP_Project2_MCTS)
+        self.search = search
+        self.nodes = 0
+        self.cutoffs = 0
+        self.killers: Dict[int, Tuple[int, int]] = {}
+        self.history: Dict[Tuple[int, int], int] = {}
+
+        # Seconds per computer move; None searches to the end of the game
+        self.time_budget = time_budget
+        self.deadline: Optional[float] = None
+
+        # More than one worker spreads the root moves over a process pool
+        self.workers = workers
+
+        # Finished games from play() are appended here when set
+        self.game_log = game_log
+
+        # Per-move search statistics (see MP_Project2_Stats); None turns them off
+        self.stats = stats
+        self.max_ply = 0
+
+        # ponder=True searches O's replies in the background while X is thinking (see Ponderer).
+        # cancel is the Event a pondering search polls, alongside the deadline, to stop early.
+        self.ponder = ponder
+        self.cancel: Optional[threading.Event] = None
+
+        # Playouts per move for search="mcts"; the tree is built on first use and kept between moves
+        if playouts is not None and playouts < 1:
+            raise ValueError(f"playouts must be at least 1, got {playouts}")
+        self.playouts = playouts
+        self.mcts: Optional[MCTS] = None
+
+    @property
+    def board(self) -> Tuple[Tuple[str, ...], ...]:
+        """
+        The current position as read-only rows; assign to board to change it.
+        """
+        return self._position.grid()
+
+    @board.setter
+    def board(self, board: Board) -> None:
+        if isinstance(board, Position):
+            self._position = board
+        else:
+            self._position = Position.from_rows(board, self.win_length)
+        # (row, col) of each makeMove since the board was assigned, for the game log
+        self.moves: List[Tuple[int, int]] = []
+
+    def _searchBoard(self) -> Board:
+        """
+        A private mutable copy of the position for a search to make and unmake moves on.
+        """
+        if self.bitboard:
+            return BitBoard(self._position.x, self._position.o)
+        return self._position.rows()
+
+    def makeMove(self, row: int, col: int, mark: str) -> None:
+        """
+        Place a mark: the game moves on to the child position.
+        """
+        self._position = self._position.play(row, col, mark)
+        self.moves.append((row, col))
+
+    def unmakeMove(self, row: int, col: int) -> None:
+        """
+        Take a mark back off the board.
+        """
+        self._position = self._position.cleared(row, col)
+        self.moves.remove((row, col))
+
+    def _logGame(self, last: str, x_player: str, o_player: str) -> None:
+        """
+        Append the finished game to the game log, if there is one.
+        'last' is the mark that made the final move.
+        """
+        if self.game_log is not None:
+            result = last if self.checkWin(last) else "draw"
+            self.game_log.record(self.moves, result, x_player, o_player)
 
     def printBoard(self) -> None:
         """
@@ -36,10 +347,10 @@ class TicTacToe:
         """
         print()
         print(self.sep)
-        print("|R\\C| 0 | 1 | 2 |")
+        print("|R\\C|" + "".join(f" {c} |" for c in range(self.size)))
         print(self.sep)
-        for r in range(3):
-            print(f"| {r} | {self.board[r][0]} | {self.board[r][1]} | {self.board[r][2]} |")
+        for r in range(self.size):
+            print(f"| {r} |" + "".join(f" {self._position.at(r, c)} |" for c in range(self.size)))
             print(self.sep)
         print()
 
@@ -47,60 +358,28 @@ class TicTacToe:
         """
         Reset the board to start a new game.
         """
-        self.board = []
-        for _ in range(3):
-            row = []
-            for _ in range(3):
-                row.append(" ")
-            self.board.append(row)
+        self.board = Position.empty(self.size, self.win_length)
         self.turn = "X"
 
     def validateEntry(self, row: int, col: int) -> bool:
         """
         Validate that a proposed move is on the board and empty.
         """
-        if not (0 <= row <= 2 and 0 <= col <= 2):
-            return False
-        return self.board[row][col] == " "
+        return self._position.is_legal(row, col)
 
     def checkFull(self) -> bool:
         """
         Check whether the board has any empty spaces remaining.
         Returns True if the board is full.
         """
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == " ":
-                    return False
-        return True
+        return self._position.is_full()
 
     def checkWin(self, turn: str) -> bool:
         """
-        Check all winning possibilities for a specific player.
-        """
-        lines = [
-            # rows
-            [(0, 0), (0, 1), (0, 2)],
-            [(1, 0), (1, 1), (1, 2)],
-            [(2, 0), (2, 1), (2, 2)],
-            # cols
-            [(0, 0), (1, 0), (2, 0)],
-            [(0, 1), (1, 1), (2, 1)],
-            [(0, 2), (1, 2), (2, 2)],
-            # diagonals
-            [(0, 0), (1, 1), (2, 2)],
-            [(0, 2), (1, 1), (2, 0)],
-        ]
-
-        for line in lines:
-            all_match = True
-            for r, c in line:
-                if self.board[r][c] != turn:
-                    all_match = False
-                    break
-            if all_match:
-                return True
-        return False
+        Check all winning possibilities for a specific player
+        (one mask test per winning line).
+        """
+        return self._position.has_won(turn)
 
     def checkEnd(self, turn: str) -> bool:
         """
@@ -136,7 +415,7 @@ class TicTacToe:
         if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
             print("Invalid entry: try again.")
             print()
-            print("Row & column numbers must be either 0, 1, or 2.")
+            print(f"Row & column numbers must be either {self._rangeText()}.")
             print()
             return self._promptAndApplyMove(player)
 
@@ -148,15 +427,15 @@ class TicTacToe:
         print()
 
         # Bound Check
-        if not (0 <= r <= 2 and 0 <= c <= 2):
+        if not (0 <= r < self.size and 0 <= c < self.size):
             print("Invalid entry: try again.")
             print()
-            print("Row & column numbers must be either 0, 1, or 2.")
+            print(f"Row & column numbers must be either {self._rangeText()}.")
             print()
             return self._promptAndApplyMove(player)
 
         # Already selected alternative
-        if self.board[r][c] != " ":
+        if self._position.at(r, c) != " ":
             print("That cell is already taken.")
             print()
             print("Please make another selection.")
@@ -165,90 +444,449 @@ class TicTacToe:
 
         print("Thank you for your selection.")
         print()
-        self.board[r][c] = player
+        self.makeMove(r, c, player)
+
+    def _rangeText(self) -> str:
+        """
+        Valid row/column numbers for messages, e.g. "0, 1, or 2".
+        """
+        nums = [str(i) for i in range(self.size)]
+        return ", ".join(nums[:-1]) + ", or " + nums[-1]
 
     # ===================== NEW FUNCTIONS (Minimax) =====================
 
-    def minimax(self, board: Board, is_maximizing: bool) -> int:
-
-        # All possible winning lines 
-        lines = [
-            [(0, 0), (0, 1), (0, 2)],
-            [(1, 0), (1, 1), (1, 2)],
-            [(2, 0), (2, 1), (2, 2)],
-            [(0, 0), (1, 0), (2, 0)],
-            [(0, 1), (1, 1), (2, 1)],
-            [(0, 2), (1, 2), (2, 2)],
-            [(0, 0), (1, 1), (2, 2)],
-            [(0, 2), (1, 1), (2, 0)],
-        ]
-
-        # Using the following for loop to check terminal state
-        for line in lines:
-            values = [board[r][c] for r, c in line]
-            if values == ["O", "O", "O"]:
-                return 1     
-            if values == ["X", "X", "X"]:
-                return -1     
-
-        # Check draw 
-        is_full = True
-        for r in range(3):
-            for c in range(3):
-                if board[r][c] == " ":
-                    is_full = False
-                    break
-            if not is_full:
-                break
-        if is_full:
+    def minimax(self, board: Board, is_maximizing: bool, counter: Optional[LineCounter] = None) -> int:
+        """
+        Score a position for O (+1 win, -1 loss, 0 draw), using the transposition table.
+        counter must match board; it is built from the board when not given.
+        """
+        self.nodes += 1
+        if counter is None:
+            counter = LineCounter.from_board(board, self.win_length)
+        if self.stats is not None and counter.moves > self.max_ply:
+            self.max_ply = counter.moves
+        # The shared table serves every board size and win length, so both are in the key
+        key = (canonical_key(board), is_maximizing, self.win_length)
+        score = self.table.get(key)
+        if score is None:
+            score = self._minimax_search(board, is_maximizing, counter)
+            self.table.put(key, score)
+        return score
+
+    def _minimax_search(self, board: Board, is_maximizing: bool, counter: LineCounter) -> int:
+
+        # Check terminal state
+        if counter.has_won("O"):
+            return 1
+        if counter.has_won("X"):
+            return -1
+
+        # Check draw
+        if counter.is_full():
             return 0
+        moves = counter.empty_cells()
 
-        # Recursive minimax search
+        # Recursive minimax search (make move, score it, unmake it)
         if is_maximizing:
             # Computer's turn: maximize score
             best_score = -999
-            for r in range(3):
-                for c in range(3):
-                    if board[r][c] == " ":
-                        board[r][c] = "O"
-                        score = self.minimax(board, False)
-                        board[r][c] = " "
-                        if score > best_score:
-                            best_score = score
+            for r, c in moves:
+                counter.apply(board, r, c, "O")
+                score = self.minimax(board, False, counter)
+                counter.undo(board, r, c, "O")
+                if score > best_score:
+                    best_score = score
             return best_score
         else:
             # Human's turn: minimize score
             best_score = 999
-            for r in range(3):
-                for c in range(3):
-                    if board[r][c] == " ":
-                        board[r][c] = "X"
-                        score = self.minimax(board, True)
-                        board[r][c] = " "
-                        if score < best_score:
-                            best_score = score
+            for r, c in moves:
+                counter.apply(board, r, c, "X")
+                score = self.minimax(board, True, counter)
+                counter.undo(board, r, c, "X")
+                if score < best_score:
+                    best_score = score
             return best_score
 
+    def evaluate(self, board: Board, turn: str, counter: Optional[LineCounter] = None) -> int:
+        """
+        Heuristic score for 'turn' where the search stops early: every line still
+        open to only one side counts 4 ** (its marks), for or against 'turn'.
+        """
+        if counter is None:
+            counter = LineCounter.from_board(board, self.win_length)
+        other = "X" if turn == "O" else "O"
+        score = 0
+        for mine, theirs in zip(counter.counts[turn], counter.counts[other]):
+            if theirs == 0 and mine:
+                score += 4 ** mine
+            elif mine == 0 and theirs:
+                score -= 4 ** theirs
+        return score
+
+    def _orderedMoves(self, counter: LineCounter, ply: int) -> List[Tuple[int, int]]:
+        """
+        Empty cells ordered by killer move, then history score, then center/corner/edge.
+        """
+        history = self.history
+        rank = self.move_rank
+        moves = counter.empty_cells()
+        moves.sort(key=lambda m: (-history.get(m, 0), rank[m]))
+        killer = self.killers.get(ply)
+        if killer in moves:
+            moves.remove(killer)
+            moves.insert(0, killer)
+        return moves
+
+    def negamax(
+        self,
+        board: Board,
+        turn: str,
+        alpha: int,
+        beta: int,
+        ply: int,
+        depth: Optional[int] = None,
+        counter: Optional[LineCounter] = None,
+    ) -> int:
+        """
+        Alpha-beta search in negamax form, scored for 'turn' (the side to move).
+        ply is the number of marks on the board, which makes the score depth-aware.
+        depth limits how many more moves are searched before evaluate() is used;
+        None searches to the end of the game. counter must match board and is
+        built from it when not given.
+        """
+        self.nodes += 1
+        if self.stats is not None and ply > self.max_ply:
+            self.max_ply = ply
+        if self.deadline is not None and self.nodes & 1023 == 0:
+            if time.monotonic() > self.deadline or (self.cancel is not None and self.cancel.is_set()):
+                raise _SearchTimeout()
+        other = "X" if turn == "O" else "O"
+        if counter is None:
+            counter = LineCounter.from_board(board, self.win_length)
+
+        # The previous move may have ended the game
+        if counter.has_won(other):
+            return -(WIN_SCORE - ply)
+        if counter.is_full():
+            return 0
+        if depth is None:
+            depth = self.cells - ply
+        if depth == 0:
+            return self.evaluate(board, turn, counter)
+
+        alpha_orig = alpha
+        key = (canonical_key(board), turn, self.win_length)
+        entry = self.table.get(key)
+        if entry is not None:
+            score, flag, entry_depth = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        best_score = -WIN_SCORE - 1
+        for r, c in self._orderedMoves(counter, ply):
+            counter.apply(board, r, c, turn)
+            score = -self.negamax(board, other, -beta, -alpha, ply + 1, depth - 1, counter)
+            counter.undo(board, r, c, turn)
+            if score > best_score:
+                best_score = score
+            if best_score > alpha:
+                alpha = best_score
+            if alpha >= beta:
+                # Remember the refutation for sibling nodes and later searches
+                self.cutoffs += 1
+                self.killers[ply] = (r, c)
+                self.history[(r, c)] = self.history.get((r, c), 0) + depth ** 2
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.put(key, (best_score, flag, depth))
+        return best_score
+
     def get_best_move(self) -> Tuple[int, int]:
         """
         Here, I am using the function minimax to choose the best move for the computer (O).
+        With search="alphabeta" the pruned negamax search is used instead.
+        A loaded solution table answers directly when it has the position.
+        """
+        return self._searchMove()[0]
+
+    def position(self) -> Position:
+        """
+        The current position; it is immutable, so it can be handed to other threads as is.
+        """
+        return self._position
+
+    def analyze(self, position: Position, turn: str = "O") -> Tuple[Tuple[int, int], int]:
+        """
+        Best move for 'turn' on an immutable position, and its game value for
+        'turn' (1 win, 0 draw or undecided, -1 loss). self.board is never touched:
+        the search runs on a private copy of the engine's per-search state and
+        shares only the transposition and solution tables, so one engine can
+        answer concurrent calls from a thread pool.
+        """
+        if len(position) != self.cells:
+            raise ValueError(f"expected {self.cells} cells, got {len(position)}")
+        position = Position.from_cells(position, self.size, self.win_length)
+        if turn == "X":
+            position = position.swapped()
+        return self._forkSearcher(position)._searchMove()
+
+    def _forkSearcher(self, board) -> "TicTacToe":
+        """
+        Shallow copy of the engine searching 'board' with its own per-search state;
+        only the transposition and solution tables stay shared.
+        """
+        searcher = copy.copy(self)
+        searcher.nodes = 0
+        searcher.cutoffs = 0
+        searcher.killers = {}
+        searcher.history = {}
+        searcher.deadline = None
+        # The MCTS tree is not shared between threads; the fork grows its own
+        searcher.mcts = None
+        searcher.board = board
+        return searcher
+
+    def _gameValue(self, score: int) -> int:
+        """
+        1 / 0 / -1 for a negamax score: a forced win, anything undecided, a forced loss.
+        """
+        if score > WIN_SCORE - self.cells - 1:
+            return 1
+        if score < -(WIN_SCORE - self.cells - 1):
+            return -1
+        return 0
+
+    def _searchMove(self) -> Tuple[Tuple[int, int], int]:
+        """
+        _bestMoveAndValue(), recording a SearchStats entry when stats are on.
         """
+        if self.stats is None:
+            return self._bestMoveAndValue()
+        move, value, entry = self._measuredSearch()
+        self.stats.record(entry)
+        return move, value
+
+    def _measuredSearch(self) -> Tuple[Tuple[int, int], int, Dict[str, object]]:
+        """
+        _bestMoveAndValue() plus the SearchStats entry describing it, not yet recorded.
+        Depth is only tracked while self.stats is set.
+        """
+        self.nodes = 0
+        self.cutoffs = 0
+        root_ply = self._position.count()
+        self.max_ply = root_ply
+        hits, misses = self.table.hits, self.table.misses
+        start = time.perf_counter()
+        move, value = self._bestMoveAndValue()
+        seconds = time.perf_counter() - start
+
+        if self.nodes == 0 and self.solution is not None:
+            source = "solution"
+        elif self.workers > 1:
+            source = "parallel"
+        else:
+            source = self.search
+        depth = self.max_ply - root_ply
+        entry = {
+            "move": list(move),
+            "value": value,
+            "source": source,
+            "ply": root_ply,
+            "nodes": self.nodes,
+            "max_depth": depth,
+            "seconds": seconds,
+            "branching": self.nodes ** (1.0 / depth) if depth else 0.0,
+            "cutoffs": self.cutoffs,
+            "tt_hits": self.table.hits - hits,
+            "tt_misses": self.table.misses - misses,
+        }
+        return move, value, entry
+
+    def _bestMoveAndValue(self) -> Tuple[Tuple[int, int], int]:
+        """
+        O's move on self.board and its game value for O.
+        """
+        if self.solution is not None and self.cells == 9 and self.win_length == 3:
+            entry = self.solution.lookup(self._position)
+            if entry is not None:
+                return divmod(entry[1], 3), entry[0]
+
+        if self.search == "mcts":
+            return self._mctsMove()
+
+        if self.workers > 1:
+            return self._parallelMove()
+
+        if self.search == "alphabeta":
+            return self._alphaBetaMove()
+
         best_score = -999
         best_move = (0, 0)
+        board = self._searchBoard()
+        counter = LineCounter.from_board(board, self.win_length)
 
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == " ":
+        for r, c in counter.empty_cells():
+            counter.apply(board, r, c, "O")
+            score = self.minimax(board, False, counter)
+            counter.undo(board, r, c, "O")
+            if score > best_score:
+                best_score = score
+                best_move = (r, c)
 
-                    self.board[r][c] = "O"
-                    score = self.minimax(self.board, False)
+        # A full board has no moves to score
+        if best_score == -999:
+            return best_move, 0
+        return best_move, best_score
 
-                    self.board[r][c] = " "
-                    if score > best_score:
-                        best_score = score
-                        best_move = (r, c)
+    def _mctsMove(self) -> Tuple[Tuple[int, int], int]:
+        """
+        Monte Carlo tree search for O. The value is the mean playout result
+        of the chosen move rounded to a win, draw or loss, so it is only an estimate.
+        """
+        if self.mcts is None:
+            self.mcts = MCTS(self.size, self.win_length, self.playouts, self.time_budget)
+        move = self.mcts.search(self._position, "O", self.cancel)
+        report = self.mcts.last
+        self.nodes += report["playouts"]
+        self.max_ply += report["max_depth"]
+        return move, round(report["value"])
 
-        return best_move
+    def _alphaBetaMove(self) -> Tuple[Tuple[int, int], int]:
+        """
+        Root of the alpha-beta search for O; ties keep the first move in search order.
+        Without a time budget it searches to the end of the game. With one, it
+        deepens one move at a time and returns the best move found before time ran out.
+        Returns the move and its game value for O.
+        """
+        # Fresh ordering state keeps the root order (and so tie-breaks) the same every move
+        self.killers = {}
+        self.history = {}
+        board = self._searchBoard()
+        counter = LineCounter.from_board(board, self.win_length)
+        ply = counter.moves
+        moves = self._orderedMoves(counter, ply)
+        if not moves:
+            return (0, 0), 0
+
+        remaining = self.cells - ply
+        if self.time_budget is None:
+            depths = [remaining]
+        else:
+            depths = list(range(1, remaining + 1))
+            self.deadline = time.monotonic() + self.time_budget
+
+        best_move = moves[0]
+        best_score = 0
+        try:
+            for depth in depths:
+                # The previous iteration's best move is searched first
+                moves.remove(best_move)
+                moves.insert(0, best_move)
+                alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+                iter_best = None
+                try:
+                    for r, c in moves:
+                        counter.apply(board, r, c, "O")
+                        score = -self.negamax(board, "X", -beta, -alpha, ply + 1, depth - 1, counter)
+                        counter.undo(board, r, c, "O")
+                        if score > alpha:
+                            alpha = score
+                            iter_best = (r, c)
+                except _SearchTimeout:
+                    # Anything that beat the previous best at this depth is still an improvement
+                    if iter_best is not None:
+                        best_move = iter_best
+                        best_score = alpha
+                    break
+                best_move = iter_best
+                best_score = alpha
+                # A forced win or loss will not change with a deeper search
+                if abs(alpha) > WIN_SCORE - self.cells - 1:
+                    break
+        finally:
+            self.deadline = None
+
+        return best_move, self._gameValue(best_score)
+
+    def _scoreRootMove(
+        self, board: Board, move: Tuple[int, int], depth: int, deadline: Optional[float]
+    ) -> Optional[int]:
+        """
+        Score one root move for O with a full window, so results from
+        different workers compare exactly. Returns None on timeout.
+        """
+        counter = LineCounter.from_board(board, self.win_length)
+        counter.apply(board, move[0], move[1], "O")
+        if self.search == "minimax":
+            return self.minimax(board, False, counter)
+
+        self.killers = {}
+        self.deadline = deadline
+        try:
+            return -self.negamax(board, "X", -WIN_SCORE - 1, WIN_SCORE + 1, counter.moves, depth - 1, counter)
+        except _SearchTimeout:
+            return None
+        finally:
+            self.deadline = None
+
+    def _parallelMove(self) -> Tuple[Tuple[int, int], int]:
+        """
+        Evaluate every root move in the process pool, each on its own board copy.
+        Moves are compared in the same order the serial search uses, so ties
+        go to the same move. Returns the move and its game value for O.
+        """
+        board = self._position.rows()
+        counter = LineCounter.from_board(board, self.win_length)
+        ply = counter.moves
+        if self.search == "minimax":
+            moves = counter.empty_cells()
+        else:
+            moves = self._orderedMoves(counter, ply)
+        if not moves:
+            return (0, 0), 0
+
+        remaining = self.cells - ply
+        if self.time_budget is None or self.search == "minimax":
+            depths = [remaining]
+            deadline = None
+        else:
+            depths = list(range(1, remaining + 1))
+            deadline = time.monotonic() + self.time_budget
+
+        pool = get_pool(self.workers)
+        spec = (self.size, self.win_length, self.search)
+        best_move = moves[0]
+        best_score = 0
+        for depth in depths:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+            futures = [pool.submit(_score_root_move, spec, board, m, depth, deadline) for m in moves]
+            scores = [f.result() for f in futures]
+            if None in scores:
+                # Keep the last depth that every move finished
+                break
+            best_score = max(scores)
+            best_move = moves[scores.index(best_score)]
+            if abs(best_score) > WIN_SCORE - self.cells - 1:
+                break
+
+        if self.search == "minimax":
+            return best_move, best_score
+        return best_move, self._gameValue(best_score)
 
 
 
@@ -264,23 +902,35 @@ class TicTacToe:
             print()
             self.resetBoard()
             self.printBoard()
+            if self.stats is not None:
+                self.stats.startGame()
 
             current = "X"
+            ponderer: Optional[Ponderer] = None
 
             while True:
                 if current == "X":
-                    # Human move
+                    # Human move; with pondering, O's replies are searched while X thinks
+                    if self.ponder:
+                        ponderer = Ponderer(self)
                     self._promptAndApplyMove("X")
                 else:
                     # Computer move using Minimax
                     print("Player 2's (O) turn.")
-                    row, col = self.get_best_move()
-                    self.board[row][col] = "O"
+                    reply = ponderer.reply(self.moves[-1]) if ponderer is not None else None
+                    ponderer = None
+                    row, col = reply if reply is not None else self.get_best_move()
+                    self.makeMove(row, col, "O")
                     print(f"Player 2 chose: {row}, {col}")
+                    if self.stats is not None:
+                        print(f"Search: {describe(self.stats.moves[-1])}")
                     print()
 
                 # Check if game ended after this move
                 if self.checkEnd(current):
+                    self._logGame(current, "human", "minimax")
+                    if ponderer is not None:
+                        ponderer.stop()
                     break
 
                 self.printBoard()
@@ -294,8 +944,159 @@ class TicTacToe:
                 return
 
 
+class Ponderer:
+    """
+    Searches O's reply to every possible X move on a background thread while
+    the human is at the prompt. Candidates are taken in the engine's move order;
+    each is searched like a normal computer move (same time budget) on a
+    forked engine, so the results are the moves get_best_move would return.
+    Everything found also lands in the shared transposition table. With stats
+    on, a reply that is used is recorded with source "ponder"; searches for X
+    moves that were not played are not recorded.
+    """
+
+    def __init__(self, engine: TicTacToe):
+        self.engine = engine
+        self.position = engine.position()
+        # X move -> (O's reply, its stats entry or None)
+        self.results: Dict[Tuple[int, int], Tuple[Tuple[int, int], Optional[Dict[str, object]]]] = {}
+        self.current: Optional[Tuple[int, int]] = None
+        self.lock = threading.Lock()
+        # halt: finish the current candidate and stop; cancel: also abort the current search
+        self.halt = threading.Event()
+        self.cancel = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="ponder", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        engine = self.engine
+        for r, c in engine.move_order:
+            if self.halt.is_set():
+                return
+            if not self.position.is_legal(r, c):
+                continue
+            child = self.position.play(r, c, "X")
+            if child.has_won("X") or child.is_full():
+                continue
+            searcher = engine._forkSearcher(child)
+            # One thread and a deadline that only the cancel event can trip
+            searcher.workers = 1
+            searcher.cancel = self.cancel
+            searcher.deadline = math.inf
+            with self.lock:
+                self.current = (r, c)
+            if searcher.stats is not None:
+                # Measured here, recorded by reply() only if X plays this move
+                move, _, entry = searcher._measuredSearch()
+                entry["source"] = "ponder"
+            else:
+                move, entry = searcher.get_best_move(), None
+            with self.lock:
+                self.current = None
+                if self.cancel.is_set():
+                    return
+                self.results[(r, c)] = (move, entry)
+
+    def reply(self, move: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        O's pondered reply to X's 'move'. If that move is being searched right
+        now, the search is allowed to finish; otherwise pondering is cancelled
+        and None is returned, so the caller searches normally (with a warm table).
+        """
+        with self.lock:
+            if move in self.results:
+                found = self.results[move]
+            elif self.current == move:
+                found = None
+                self.halt.set()
+            else:
+                found = None
+        if found is not None or not self.halt.is_set():
+            self.stop()
+        else:
+            self.thread.join()
+            found = self.results.get(move)
+        if found is None:
+            return None
+        reply, entry = found
+        if entry is not None:
+            self.engine.stats.record(entry)
+        return reply
+
+    def stop(self) -> None:
+        """
+        Abort the background search and wait for the thread to exit.
+        """
+        self.halt.set()
+        self.cancel.set()
+        self.thread.join()
+
+
+def compare_search(board: Optional[Board] = None) -> Dict[str, int]:
+    """
+    Count nodes visited by the exhaustive minimax and by alpha-beta on the same position.
+    Transposition tables are disabled so only the pruning gain is measured.
+    """
+    counts = {}
+    for search in ("minimax", "alphabeta"):
+        game = TicTacToe(table=TranspositionTable(max_size=0), search=search)
+        if board is not None:
+            game.board = [row[:] for row in board]
+        game.get_best_move()
+        counts[search] = game.nodes
+    return counts
+
+
 def main():
-    TicTacToe().play()
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe against a minimax computer player.")
+    parser.add_argument("--bitboard", action="store_true", help="store the 3x3 board as bitmasks")
+    parser.add_argument("--compare-search", action="store_true", help="print minimax vs alpha-beta node counts")
+    parser.add_argument("--size", type=int, default=3, help="board is size x size (default 3)")
+    parser.add_argument("--win-length", type=int, default=None, help="marks in a row needed to win (default size)")
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds per computer move")
+    parser.add_argument("--workers", type=int, default=1, help="processes for root-move search (default 1)")
+    parser.add_argument("--game-log", default=None, help="append finished games to this binary log")
+    parser.add_argument("--stats", default=None, help="print search statistics and append them to this JSON lines file")
+    parser.add_argument("--ponder", action="store_true", help="search O's replies while X is thinking")
+    parser.add_argument("--search", choices=["alphabeta", "minimax", "mcts"], default="alphabeta")
+    parser.add_argument("--playouts", type=int, default=None, help="MCTS playouts per move")
+    args = parser.parse_args()
+
+    if args.compare_search:
+        counts = compare_search()
+        print(f"minimax nodes:   {counts['minimax']}")
+        print(f"alphabeta nodes: {counts['alphabeta']}")
+        return
+    # Falls back to live search if the table file is missing or stale
+    solution = SolutionTable.load()
+    try:
+        game_log = GameLogWriter(args.game_log, args.size) if args.game_log else None
+    except ValueError as error:
+        parser.error(str(error))
+    stats = SearchStats(args.stats) if args.stats else None
+    try:
+        try:
+            game = TicTacToe(
+                search=args.search,
+                bitboard=args.bitboard,
+                solution=solution,
+                size=args.size,
+                win_length=args.win_length,
+                time_budget=args.time_budget,
+                workers=args.workers,
+                game_log=game_log,
+                stats=stats,
+                ponder=args.ponder,
+                playouts=args.playouts,
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        game.play()
+    finally:
+        if game_log is not None:
+            game_log.close()
+        if stats is not None:
+            stats.close()
 
 if __name__ == "__main__":
     main()
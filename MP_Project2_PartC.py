@@ -9,34 +9,122 @@ Overview:
     accepts input as "row,column", model predicts best move, and checks for wins across
     rows/columns/diagonals or a draw on a full board. After each round it offers
     to start a new game without restarting the program.
+
+    numpy and scikit-learn are imported only where they are used, and
+    main() loads (or trains) the model on a background thread while the
+    board is shown and X makes the first move.
 -----------------------------------------------------------------------------
 """
+from __future__ import annotations
+
+import time
+
+# Start of module loading; the time-to-first-prompt fallback where /proc is not available
+_LOAD_STARTED = time.perf_counter()
+
+import argparse
+import hashlib
+import os
+import pickle
+import platform
+import sys
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-from typing import List
-import numpy as np
-from sklearn.svm import SVC
-from sklearn.model_selection import train_test_split, GridSearchCV
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from MP_Project2_Bitboard import BitBoard, reachable
+from MP_Project2_GameLog import GameLogWriter
+from MP_Project2_Position import Position
+from MP_Project2_Solution import TABLE_SIZE
+
+if TYPE_CHECKING:
+    import numpy as np
+    from sklearn.svm import SVC
+
+    from MP_Project2_FastSVC import NumpySVC
 
 Board = List[List[str]]
 
+DATASET_FILE = "tictac_single.txt"
+MODEL_CACHE_FILE = "svc_model_cache.pkl"
+# Same name as MP_Project2_FastSVC.EXPORT_FILE, kept here so that module (and numpy) load lazily
+EXPORT_FILE = "svc_export.npz"
+
+# Marks an unreachable / non-O-to-move slot in a compiled move table
+NO_MOVE = 255
+
+# Hyperparameters searched by GridSearchCV (part of the model cache key)
+PARAM_GRID = {
+    "C": [0.1, 1, 10, 100],
+    "kernel": ["linear", "rbf"],
+    "gamma": ["scale"],
+}
+
+# How PARAM_GRID is searched: successive halving, a fixed random budget, or every candidate.
+# The exhaustive grid stays the default: it reports model memory for every candidate and
+# picks the best one from the same full-data round; halving and random are opt-in.
+SEARCH_STRATEGIES = ("halving", "random", "grid")
+DEFAULT_STRATEGY = "grid"
+
+# Grid points tried by the randomized search
+RANDOM_ITERATIONS = 4
+
+# libsvm kernel cache per fit, in MB (SVC's own default)
+KERNEL_CACHE_MB = 200
+
 
 # Base TicTacToe class
 # -----------------------------------------------------------------------------
 class TicTacToe:
-    def __init__(self):
+    def __init__(self, game_log: Optional[GameLogWriter] = None):
 
-        self.board: Board = []
-        for _ in range(3):
-            row = []
-            for _ in range(3):
-                row.append(" ")
-            self.board.append(row)
+        # The game state is an immutable Position (see MP_Project2_Position), which is
+        # already stored as bitmasks; self.board is a read-only board[r][c] view of it.
+        self.resetBoard()
 
         # Starting the first turn as X
         self.turn: str = "X"
         self.sep = "." * 17
 
+        # Finished games from play() are appended here when set
+        self.game_log = game_log
+
+    @property
+    def board(self) -> Tuple[Tuple[str, ...], ...]:
+        """
+        The current position as read-only rows; assign to board to change it.
+        """
+        return self._position.grid()
+
+    @board.setter
+    def board(self, board: Board) -> None:
+        self._position = board if isinstance(board, Position) else Position.from_rows(board)
+        # (row, col) of each makeMove since the board was assigned, for the game log
+        self.moves: List[Tuple[int, int]] = []
+
+    def makeMove(self, row: int, col: int, mark: str) -> None:
+        """
+        Place a mark: the game moves on to the child position.
+        """
+        self._position = self._position.play(row, col, mark)
+        self.moves.append((row, col))
+
+    def unmakeMove(self, row: int, col: int) -> None:
+        """
+        Take a mark back off the board.
+        """
+        self._position = self._position.cleared(row, col)
+        self.moves.remove((row, col))
+
+    def _logGame(self, last: str, x_player: str, o_player: str) -> None:
+        """
+        Append the finished game to the game log, if there is one.
+        'last' is the mark that made the final move.
+        """
+        if self.game_log is not None:
+            result = last if self.checkWin(last) else "draw"
+            self.game_log.record(self.moves, result, x_player, o_player)
+
     def printBoard(self) -> None:
         """
         Printing the current board grid.
@@ -46,7 +134,8 @@ class TicTacToe:
         print("|R\\C| 0 | 1 | 2 |")
         print(self.sep)
         for r in range(3):
-            print(f"| {r} | {self.board[r][0]} | {self.board[r][1]} | {self.board[r][2]} |")
+            cells = self._position[r * 3:(r + 1) * 3]
+            print(f"| {r} | {cells[0]} | {cells[1]} | {cells[2]} |")
             print(self.sep)
         print()
 
@@ -54,60 +143,32 @@ class TicTacToe:
         """
         We can reset the board with this function.
         """
-        self.board = []
-        for _ in range(3):
-            row = []
-            for _ in range(3):
-                row.append(" ")
-            self.board.append(row)
+        self.board = Position.empty()
         self.turn = "X"
 
+    def position(self) -> Position:
+        """
+        The current position; it is immutable, so it can be handed to other threads as is.
+        """
+        return self._position
+
     def validateEntry(self, row: int, col: int) -> bool:
         """
         This allows us to validate that a proposed move is on the board.
         """
-        if not (0 <= row <= 2 and 0 <= col <= 2):
-            return False
-        return self.board[row][col] == " "
+        return self._position.is_legal(row, col)
 
     def checkFull(self) -> bool:
         """
         We can check whether the board has any empty spaces remaining.
-        Iterate over cells; returns True if none are empty.
         """
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == " ":
-                    return False
-        return True
+        return self._position.is_full()
 
     def checkWin(self, turn: str) -> bool:
         """
-        All winning possibilities are checked for a match.
-        """
-        lines = [
-            # rows
-            [(0, 0), (0, 1), (0, 2)],
-            [(1, 0), (1, 1), (1, 2)],
-            [(2, 0), (2, 1), (2, 2)],
-            # cols
-            [(0, 0), (1, 0), (2, 0)],
-            [(0, 1), (1, 1), (2, 1)],
-            [(0, 2), (1, 2), (2, 2)],
-            # diagonals
-            [(0, 0), (1, 1), (2, 2)],
-            [(0, 2), (1, 1), (2, 0)],
-        ]
-
-        for line in lines:
-            all_match = True
-            for r, c in line:
-                if self.board[r][c] != turn:
-                    all_match = False
-                    break
-            if all_match:
-                return True
-        return False
+        All winning possibilities are checked for a match, one mask test per line.
+        """
+        return self._position.has_won(turn)
 
     def checkEnd(self, turn: str) -> bool:
         """
@@ -163,7 +224,7 @@ class TicTacToe:
             return self._promptAndApplyMove(player)
 
     
-        if self.board[r][c] != " ":
+        if self._position.at(r, c) != " ":
             print("That cell is already taken.")
             print()
             print("Please make another selection.")
@@ -172,7 +233,7 @@ class TicTacToe:
 
         print("Thank you for your selection.")
         print()
-        self.board[r][c] = player
+        self.makeMove(r, c, player)
 
     def play(self):
 
@@ -187,6 +248,7 @@ class TicTacToe:
                 self._promptAndApplyMove(current)
 
                 if self.checkEnd(current):
+                    self._logGame(current, "human", "human")
                     break
 
                 self.printBoard()
@@ -209,35 +271,83 @@ class TicTacToeML(TicTacToe):
     Player 2: O (SVC model trained on optimal O moves)
     """
 
-    def __init__(self, model: SVC):
-        super().__init__()
+    def __init__(
+        self,
+        model: Optional[SVC] = None,
+        move_table: Optional[np.ndarray] = None,
+        game_log: Optional[GameLogWriter] = None,
+        pending: Optional[Future] = None,
+    ):
+        super().__init__(game_log)
         self.model = model
+        # Optional compile_move_table() output: the model's move for every O-to-move board
+        self.move_table = move_table
+        # A start_model_warmup() future; model and move_table are taken from it on first use
+        self.pending = pending
+        # perf_counter() at process start; when set, play() reports the time to X's first prompt
+        self.started_at: Optional[float] = None
+
+    def _waitForModel(self) -> None:
+        if self.pending is not None:
+            self.model, self.move_table = self.pending.result()
+            self.pending = None
 
     def _board_to_features(self) -> np.ndarray:
+        import numpy as np
 
-        mapping = {"X": 1, "O": -1, " ": 0}
-        vals = [mapping[self.board[r][c]] for r in range(3) for c in range(3)]
-        return np.array(vals, dtype=int).reshape(1, -1)
+        return np.array(self._position.features(), dtype=int).reshape(1, -1)
 
     def _ml_move(self) -> None:
         """
         Using the trained SVC model to decide O's move.
         If predicted move is invalid, model chooses first available cell.
         """
-        features = self._board_to_features()
-        move_index = int(self.model.predict(features)[0])
+        if self.pending is not None and not self.pending.done():
+            print("Waiting for the model to finish loading...")
+        r, c = self._ml_choose()
+        print(f"Player 2 chooses: {r}, {c}")
+        self.makeMove(r, c, "O")
 
-        r, c = divmod(move_index, 3)
+    def _ml_choose(self) -> Tuple[int, int]:
+        """
+        The model's move for O on the current board, without printing or placing it.
+        Uses the compiled move table when there is one.
+        """
+        return self.predictMove(self.position())
 
-        if not self.validateEntry(r, c):
-            for idx in range(9):
-                rr, cc = divmod(idx, 3)
-                if self.validateEntry(rr, cc):
-                    r, c = rr, cc
-                    break
+    def _ml_live_choose(self) -> Tuple[int, int]:
+        """
+        Run the model on the current board; invalid predictions fall back to the first free cell.
+        """
+        return self._livePredict(self.position())
 
-        print(f"Player 2 chooses: {r}, {c}")
-        self.board[r][c] = "O"
+    def predictMove(self, position: Position) -> Tuple[int, int]:
+        """
+        The model's move for O on an immutable position. Only the model and the
+        move table are read, never self.board, so one instance can serve
+        concurrent calls from a thread pool.
+        """
+        self._waitForModel()
+        position = Position.from_cells(position)
+        if self.move_table is not None:
+            move_index = int(self.move_table[position.ternary()])
+            if move_index != NO_MOVE:
+                return divmod(move_index, 3)
+        return self._livePredict(position)
+
+    def _livePredict(self, position: Position) -> Tuple[int, int]:
+        import numpy as np
+
+        self._waitForModel()
+        position = Position.from_cells(position)
+        features = np.array(position.features(), dtype=int).reshape(1, -1)
+        move_index = int(self.model.predict(features)[0])
+
+        if not 0 <= move_index < 9 or position[move_index] != " ":
+            if " " in position:
+                move_index = position.index(" ")
+
+        return divmod(move_index, 3)
 
     def play(self):
         """
@@ -254,11 +364,15 @@ class TicTacToeML(TicTacToe):
 
             while True:
                 if current == "X":
+                    if self.started_at is not None:
+                        print(f"(Time to first prompt: {(time.perf_counter() - self.started_at) * 1e3:.0f} ms)")
+                        self.started_at = None
                     self._promptAndApplyMove("X")
                 else:
                     self._ml_move()
 
                 if self.checkEnd(current):
+                    self._logGame(current, "human", "svc")
                     break
 
                 self.printBoard()
@@ -271,46 +385,346 @@ class TicTacToeML(TicTacToe):
 
 
 
-def train_svc_model_from_dataset() -> SVC:
+def _model_bytes(estimator: SVC, X: np.ndarray, y: np.ndarray) -> float:
     """
-    I am loading tictac_single.txt and train an SVC model with hyperparameter tuning.
+    Scorer that reports the fitted model's support-vector memory rather than its quality.
+    """
+    return float(estimator.support_vectors_.nbytes + estimator.dual_coef_.nbytes)
+
 
+def make_search(strategy: str, estimator: SVC, n_iter: int = RANDOM_ITERATIONS):
+    """
+    Hyperparameter search over PARAM_GRID for 'strategy'. Every strategy ranks
+    candidates by 5-fold accuracy and refits the best one on the training split.
     """
-    data = np.loadtxt("tictac_single.txt")
-    X = data[:, :-1]
-    y = data[:, -1].astype(int)
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (registers HalvingGridSearchCV)
+    from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV, RandomizedSearchCV
+
+    if strategy == "halving":
+        # Successive halving: all candidates on a small sample, the best third on three times as much, ...
+        # Only a single scorer is supported, so model memory is not reported here.
+        return HalvingGridSearchCV(
+            estimator, PARAM_GRID, cv=5, scoring="accuracy", n_jobs=-1, random_state=42
+        )
+    scoring = {"accuracy": "accuracy", "model_bytes": _model_bytes}
+    if strategy == "random":
+        return RandomizedSearchCV(
+            estimator, PARAM_GRID, n_iter=n_iter, cv=5, scoring=scoring, refit="accuracy",
+            n_jobs=-1, random_state=42,
+        )
+    if strategy == "grid":
+        return GridSearchCV(estimator, PARAM_GRID, cv=5, scoring=scoring, refit="accuracy", n_jobs=-1)
+    raise ValueError(f"unknown search strategy: {strategy}")
+
+
+def search_report(search) -> List[Dict[str, object]]:
+    """
+    Fit time, accuracy, rank and model memory of every candidate a search evaluated.
+    Halving searches list each candidate once per round it took part in.
+    """
+    results = search.cv_results_
+    metric = "accuracy" if "mean_test_accuracy" in results else "score"
+    rows = []
+    for i, params in enumerate(results["params"]):
+        rows.append({
+            "params": params,
+            "round": int(results["iter"][i]) if "iter" in results else 0,
+            "samples": int(results["n_resources"][i]) if "n_resources" in results else None,
+            "fit_seconds": float(results["mean_fit_time"][i]),
+            "accuracy": float(results[f"mean_test_{metric}"][i]),
+            "rank": int(results[f"rank_test_{metric}"][i]),
+            "model_kb": float(results["mean_test_model_bytes"][i]) / 1024 if "mean_test_model_bytes" in results else None,
+        })
+    return rows
+
+
+def print_search_report(search, seconds: float) -> None:
+    print(f"{'C':>6} {'kernel':>7} {'round':>6} {'samples':>8} {'fit s':>8} {'accuracy':>9} {'rank':>5} {'model KB':>9}")
+    for row in search_report(search):
+        params = row["params"]
+        samples = "-" if row["samples"] is None else str(row["samples"])
+        model_kb = "-" if row["model_kb"] is None else f"{row['model_kb']:.1f}"
+        print(
+            f"{params['C']:>6} {params['kernel']:>7} {row['round']:>6} {samples:>8} "
+            f"{row['fit_seconds']:>8.3f} {row['accuracy']:>9.4f} {row['rank']:>5} {model_kb:>9}"
+        )
+    print(f"Search took {seconds:.2f}s; best {search.best_params_} (accuracy {search.best_score_:.4f})")
+
+
+def train_svc_model_from_dataset(
+    path: str = DATASET_FILE,
+    strategy: str = DEFAULT_STRATEGY,
+    n_iter: int = RANDOM_ITERATIONS,
+    cache_size: float = KERNEL_CACHE_MB,
+    report: bool = False,
+) -> SVC:
+    """
+    I am loading tictac_single.txt and train an SVC model with hyperparameter tuning.
+    strategy is "halving", "random" (n_iter grid points) or "grid" (see make_search);
+    cache_size is libsvm's kernel cache in MB. report=True prints every candidate.
+    """
+    from sklearn.model_selection import train_test_split
+    from sklearn.svm import SVC
+
+    from MP_Project2_Dataset import load_dataset
+
+    # int8 features / uint8 labels, memory-mapped from the binary cache
+    X, y = load_dataset(path)
+    y = y.astype(int)
 
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42, stratify=y
     )
 
-    param_grid = {
-        "C": [0.1, 1, 10, 100],
-        "kernel": ["linear", "rbf"],
-        "gamma": ["scale"],
-    }
+    base_svc = SVC(decision_function_shape="ovr", cache_size=cache_size)
+
+    search = make_search(strategy, base_svc, n_iter)
+
+    start = time.perf_counter()
+    search.fit(X_train, y_train)
+    if report:
+        print_search_report(search, time.perf_counter() - start)
+    best_model: SVC = search.best_estimator_
+    if report:
+        # Fit quality only; MP_Project2_Evaluate measures how well the model plays
+        print(f"Held-out accuracy: {best_model.score(X_test, y_test):.4f}")
+
+    return best_model
+
 
-    base_svc = SVC(decision_function_shape="ovr")
+def o_to_move_features() -> np.ndarray:
+    """
+    (N, 9) features of every reachable, unfinished board with O to move.
+    """
+    import numpy as np
+
+    positions = reachable("O")
+    return np.array([BitBoard(x, o).features() for x, o in positions], dtype=int)
+
+
+def board_indices(features: np.ndarray) -> np.ndarray:
+    """
+    Base-3 board index (X=1, O=2) for each row of an (N, 9) feature array.
+    """
+    import numpy as np
+
+    digits = np.where(features == -1, 2, features)
+    return digits @ (3 ** np.arange(9))
+
+
+def compile_move_table(model: SVC) -> np.ndarray:
+    """
+    Batch-predict the model once over every O-to-move position and return a
+    uint8 table of 3**9 moves indexed by board_indices(), NO_MOVE elsewhere.
+    Illegal predictions get the same first-free-cell fallback as _ml_move.
+    """
+    import numpy as np
 
-    grid_search = GridSearchCV(
-        estimator=base_svc,
-        param_grid=param_grid,
-        cv=5,
-        scoring="accuracy",
-        n_jobs=-1,
+    features = o_to_move_features()
+    moves = model.predict(features).astype(int)
+
+    legal = features == 0
+    rows = np.arange(len(features))
+    bad = ~legal[rows, moves]
+    moves[bad] = legal[bad].argmax(axis=1)
+
+    table = np.full(TABLE_SIZE, NO_MOVE, dtype=np.uint8)
+    table[board_indices(features)] = moves
+    return table
+
+
+def verify_move_table(model: SVC, table: np.ndarray) -> List[Tuple[Board, int, int]]:
+    """
+    Compare the compiled table with the live model one position at a time.
+    Returns (board, table move, live move) for every disagreement.
+    """
+    game = TicTacToeML(model)
+    mismatches = []
+    for x, o in reachable("O"):
+        game.board = Position(x, o)
+        live_r, live_c = game._ml_live_choose()
+        compiled = int(table[game.position().ternary()])
+        if compiled != live_r * 3 + live_c:
+            mismatches.append((game.board, compiled, live_r * 3 + live_c))
+    return mismatches
+
+
+def model_cache_key(
+    path: str = DATASET_FILE, strategy: str = DEFAULT_STRATEGY, n_iter: int = RANDOM_ITERATIONS
+) -> str:
+    """
+    Hash of the dataset contents, the parameter grid, the search strategy and
+    the library versions. A cached model is only reused while this key is unchanged.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(repr(sorted(PARAM_GRID.items())).encode())
+    digest.update((f"{strategy} {n_iter}" if strategy == "random" else strategy).encode())
+    # Package metadata gives the versions without importing numpy or sklearn
+    from importlib.metadata import version
+
+    versions = f"{platform.python_version()} {version('numpy')} {version('scikit-learn')}"
+    digest.update(versions.encode())
+    return digest.hexdigest()
+
+
+def load_or_train_svc_model(
+    path: str = DATASET_FILE,
+    cache_path: str = MODEL_CACHE_FILE,
+    force_retrain: bool = False,
+    strategy: str = DEFAULT_STRATEGY,
+    n_iter: int = RANDOM_ITERATIONS,
+    cache_size: float = KERNEL_CACHE_MB,
+    report: bool = False,
+) -> SVC:
+    """
+    Load the fitted model from cache_path if it was trained on the same
+    dataset, grid, search strategy and library versions; otherwise train and save it.
+    """
+    key = model_cache_key(path, strategy, n_iter)
+
+    if not force_retrain and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("key") == key:
+                return cached["model"]
+        except Exception:
+            # A cache from another sklearn/numpy version or a truncated file can fail to
+            # unpickle with almost any error (ImportError, ValueError, TypeError, ...); retrain
+            pass
+
+    model = train_svc_model_from_dataset(path, strategy, n_iter, cache_size, report)
+
+    # Write to a temp file first so an interrupted save never leaves a broken cache
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"key": key, "model": model}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return model
+
+
+def load_numpy_svc(
+    path: str = DATASET_FILE,
+    export_path: str = EXPORT_FILE,
+    force_retrain: bool = False,
+    strategy: str = DEFAULT_STRATEGY,
+    n_iter: int = RANDOM_ITERATIONS,
+    cache_size: float = KERNEL_CACHE_MB,
+    report: bool = False,
+) -> NumpySVC:
+    """
+    NumPy-only predictor for the cached model. The exported arrays carry the
+    model cache key, so they are re-exported whenever the model would retrain.
+    """
+    from MP_Project2_FastSVC import NumpySVC, export_svc
+
+    key = model_cache_key(path, strategy, n_iter)
+    if not force_retrain and os.path.exists(export_path):
+        try:
+            fast = NumpySVC.load(export_path)
+            if fast.key == key:
+                return fast
+        except Exception:
+            # A truncated or foreign file fails in np.load/zipfile (BadZipFile, ...); re-export
+            pass
+
+    model = load_or_train_svc_model(
+        path, force_retrain=force_retrain, strategy=strategy, n_iter=n_iter, cache_size=cache_size, report=report
     )
+    return NumpySVC(export_svc(model, export_path, key))
 
-    grid_search.fit(X_train, y_train)
-    best_model: SVC = grid_search.best_estimator_
 
-    return best_model
+def process_started_at() -> float:
+    """
+    perf_counter() value at which this process started, so startup time includes the
+    interpreter and imports. Read from /proc on Linux (clock-tick resolution, usually
+    10 ms); elsewhere the time this module started loading.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the "(command)" name start at field 3; starttime is field 22
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        age = uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return time.perf_counter() - age
+    except (OSError, ValueError, IndexError, AttributeError):
+        return _LOAD_STARTED
+
+
+def start_model_warmup(load: Callable[[], object], compile_table: bool = True) -> Future:
+    """
+    Run load() (and compile_move_table) on a daemon thread. The returned future
+    resolves to (model, move_table) and can be passed to TicTacToeML(pending=...).
+    A failure is reported as soon as it happens, not only when O first needs the model.
+    """
+    future: Future = Future()
 
+    def report(done: Future) -> None:
+        err = done.exception()
+        if err is not None:
+            print(f"\nModel warm-up failed: {err!r}", file=sys.stderr)
+
+    def warm():
+        try:
+            model = load()
+            future.set_result((model, compile_move_table(model) if compile_table else None))
+        except BaseException as err:
+            future.set_exception(err)
+
+    future.add_done_callback(report)
+    # Daemon, so quitting before the model is ready does not wait for training
+    threading.Thread(target=warm, name="svc-warmup", daemon=True).start()
+    return future
 
 
 def main():
-    model = train_svc_model_from_dataset()
-    game = TicTacToeML(model)
-    game.play()
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe against an SVC model.")
+    parser.add_argument("--retrain", action="store_true", help="ignore the cached model and train again")
+    parser.add_argument("--no-compile", action="store_true", help="run the model on every move instead of a lookup table")
+    parser.add_argument("--verify-table", action="store_true", help="report positions where the table and live model disagree")
+    parser.add_argument("--numpy-svc", action="store_true", help="predict with exported arrays instead of sklearn")
+    parser.add_argument("--game-log", default=None, help="append finished games to this binary log")
+    parser.add_argument("--search", choices=SEARCH_STRATEGIES, default=DEFAULT_STRATEGY, help="hyperparameter search strategy")
+    parser.add_argument("--n-iter", type=int, default=RANDOM_ITERATIONS, help="candidates for --search random")
+    parser.add_argument("--cache-size", type=float, default=KERNEL_CACHE_MB, help="SVC kernel cache in MB")
+    parser.add_argument("--search-report", action="store_true", help="print each candidate's fit time, score and memory when training")
+    parser.add_argument("--startup-time", action="store_true", help="report the time until X's first prompt")
+    args = parser.parse_args()
+
+    search_options = {
+        "strategy": args.search,
+        "n_iter": args.n_iter,
+        "cache_size": args.cache_size,
+        "report": args.search_report,
+    }
+    loader = load_numpy_svc if args.numpy_svc else load_or_train_svc_model
+
+    # X always moves first, so the model loads while the board is shown and X thinks
+    pending = start_model_warmup(
+        lambda: loader(force_retrain=args.retrain, **search_options), compile_table=not args.no_compile
+    )
+    if args.verify_table and not args.no_compile:
+        model, move_table = pending.result()
+        mismatches = verify_move_table(model, move_table)
+        print(f"Compiled table disagrees with the live model on {len(mismatches)} positions.")
+        for board, compiled, live in mismatches:
+            print(f"  {board}: table {compiled}, live {live}")
+    try:
+        game_log = GameLogWriter(args.game_log) if args.game_log else None
+    except ValueError as error:
+        parser.error(str(error))
+    game = TicTacToeML(game_log=game_log, pending=pending)
+    if args.startup_time:
+        game.started_at = process_started_at()
+    try:
+        game.play()
+    finally:
+        if game_log is not None:
+            game_log.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,305 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Shared immutable positions
+Overview:
+    One game-state type for Parts A, B and C. A Position is two integer
+    bitmasks (X marks, O marks; bit index = row * size + col) plus a
+    reference to the shared Rules of its board size and win length:
+        - immutable and hashable, so positions can be dictionary keys,
+          set members or cache entries and shared between threads
+        - __slots__ only, 56 bytes each (a 3x3 list of lists of strings
+          is over 300), so millions fit in memory
+        - play() returns the child position by setting one bit; nothing
+          is copied
+        - has_won() is one table lookup on 3x3 and one mask test per
+          winning line on larger boards
+        - it is also a read-only sequence of its row-major cells
+          (" ", "X", "O"), so code written for tuples of cells keeps working
+    The game classes hold their state as a Position and expose it as
+    read-only board[r][c] rows (grid()). The Part B searches do not walk
+    Positions: they make and unmake moves on one mutable copy of the
+    board with a LineCounter (MP_Project2_Lines), so no child Position
+    is allocated per node.
+-----------------------------------------------------------------------------
+"""
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from MP_Project2_Bitboard import TERNARY
+from MP_Project2_Lines import winning_lines
+
+Board = List[List[str]]
+
+_RULES: Dict[Tuple[int, int], "Rules"] = {}
+
+
+class Rules:
+    """
+    Board size, win length and winning-line masks, shared by every
+    Position of that variant. Use Rules.get() so there is one per variant.
+    """
+
+    __slots__ = ("size", "win_length", "cells", "full", "lines", "wins")
+
+    def __init__(self, size: int, win_length: int):
+        self.size = size
+        self.win_length = win_length
+        self.cells = size * size
+        self.full = (1 << self.cells) - 1
+        self.lines = [
+            sum(1 << (r * size + c) for r, c in line) for line in winning_lines(size, win_length)
+        ]
+        # On 3x3, wins[bits] says whether one player's marks cover a line
+        self.wins: Optional[List[bool]] = None
+        if self.cells <= 9:
+            self.wins = [any(bits & line == line for line in self.lines) for bits in range(1 << self.cells)]
+
+    @classmethod
+    def get(cls, size: int = 3, win_length: Optional[int] = None) -> "Rules":
+        key = (size, win_length if win_length is not None else size)
+        rules = _RULES.get(key)
+        if rules is None:
+            rules = _RULES[key] = cls(*key)
+        return rules
+
+
+def _make(rules: Rules, x: int, o: int) -> "Position":
+    # The slot descriptors bypass Position.__setattr__, which refuses all writes
+    position = _new(Position)
+    _set_rules(position, rules)
+    _set_x(position, x)
+    _set_o(position, o)
+    return position
+
+
+def _restore(size: int, win_length: int, x: int, o: int) -> "Position":
+    return _make(Rules.get(size, win_length), x, o)
+
+
+class Position(Sequence):
+    """
+    Immutable board state: X and O bitmasks plus the shared Rules.
+    """
+
+    __slots__ = ("rules", "x", "o")
+
+    def __init__(self, x: int = 0, o: int = 0, size: int = 3, win_length: Optional[int] = None):
+        _set_rules(self, Rules.get(size, win_length))
+        _set_x(self, x)
+        _set_o(self, o)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
+
+    def __reduce__(self):
+        return _restore, (self.rules.size, self.rules.win_length, self.x, self.o)
+
+    @classmethod
+    def empty(cls, size: int = 3, win_length: Optional[int] = None) -> "Position":
+        return cls(0, 0, size, win_length)
+
+    @classmethod
+    def from_rows(cls, board, win_length: Optional[int] = None) -> "Position":
+        """
+        Position of a board indexed as board[r][c] (nested lists or BitBoard).
+        """
+        size = len(board)
+        x = o = 0
+        bit = 1
+        for r in range(size):
+            row = board[r]
+            for c in range(size):
+                mark = row[c]
+                if mark == "X":
+                    x |= bit
+                elif mark == "O":
+                    o |= bit
+                bit <<= 1
+        return cls(x, o, size, win_length)
+
+    @classmethod
+    def from_cells(cls, cells, size: Optional[int] = None, win_length: Optional[int] = None) -> "Position":
+        """
+        Position of a row-major sequence of " ", "X", "O" cells.
+        """
+        if isinstance(cells, Position):
+            return cells
+        if size is None:
+            size = round(len(cells) ** 0.5)
+        x = o = 0
+        for idx, mark in enumerate(cells):
+            if mark == "X":
+                x |= 1 << idx
+            elif mark == "O":
+                o |= 1 << idx
+        return cls(x, o, size, win_length)
+
+    @property
+    def size(self) -> int:
+        return self.rules.size
+
+    @property
+    def win_length(self) -> int:
+        return self.rules.win_length
+
+    def __len__(self) -> int:
+        return self.rules.cells
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return tuple(self.get(i) for i in range(*idx.indices(self.rules.cells)))
+        if idx < 0:
+            idx += self.rules.cells
+        if not 0 <= idx < self.rules.cells:
+            raise IndexError("cell index out of range")
+        bit = 1 << idx
+        if self.x & bit:
+            return "X"
+        if self.o & bit:
+            return "O"
+        return " "
+
+    def __iter__(self) -> Iterator[str]:
+        x, o = self.x, self.o
+        for idx in range(self.rules.cells):
+            yield "X" if x >> idx & 1 else "O" if o >> idx & 1 else " "
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.x == other.x and self.o == other.o and self.rules is other.rules
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.o, self.rules.size, self.rules.win_length))
+
+    def __repr__(self) -> str:
+        return f"Position({''.join(self).replace(' ', '.')!r})"
+
+    def get(self, idx: int) -> str:
+        return self[idx]
+
+    def at(self, row: int, col: int) -> str:
+        return self[row * self.rules.size + col]
+
+    def rows(self) -> Board:
+        """
+        A new mutable board[r][c] copy of the position.
+        """
+        size = self.rules.size
+        cells = list(self)
+        return [cells[r * size:(r + 1) * size] for r in range(size)]
+
+    def grid(self) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Read-only board[r][c] view: a tuple of row tuples, so writing to it raises TypeError.
+        """
+        size = self.rules.size
+        cells = tuple(self)
+        return tuple(cells[r * size:(r + 1) * size] for r in range(size))
+
+    def count(self, mark: Optional[str] = None) -> int:
+        """
+        Number of marks on the board, or of one mark if given.
+        """
+        if mark is None:
+            return bin(self.x | self.o).count("1")
+        if mark in ("X", "O"):
+            return bin(self.x if mark == "X" else self.o).count("1")
+        if mark == " ":
+            return self.rules.cells - bin(self.x | self.o).count("1")
+        return 0
+
+    @property
+    def turn(self) -> str:
+        """
+        Side to move; X always starts.
+        """
+        return "X" if bin(self.x).count("1") == bin(self.o).count("1") else "O"
+
+    def is_legal(self, row: int, col: int) -> bool:
+        """
+        True if (row, col) is on the board and empty.
+        """
+        size = self.rules.size
+        if not (0 <= row < size and 0 <= col < size):
+            return False
+        return not (self.x | self.o) >> (row * size + col) & 1
+
+    def play(self, row: int, col: int, mark: Optional[str] = None) -> "Position":
+        """
+        The child position after 'mark' (default: the side to move) takes (row, col).
+        """
+        if not self.is_legal(row, col):
+            raise ValueError(f"illegal move {row},{col}")
+        if mark is None:
+            mark = self.turn
+        bit = 1 << (row * self.rules.size + col)
+        if mark == "X":
+            return _make(self.rules, self.x | bit, self.o)
+        return _make(self.rules, self.x, self.o | bit)
+
+    def cleared(self, row: int, col: int) -> "Position":
+        """
+        The position with (row, col) emptied again.
+        """
+        keep = ~(1 << (row * self.rules.size + col))
+        return _make(self.rules, self.x & keep, self.o & keep)
+
+    def has_won(self, mark: str) -> bool:
+        bits = self.x if mark == "X" else self.o
+        if self.rules.wins is not None:
+            return self.rules.wins[bits]
+        for line in self.rules.lines:
+            if bits & line == line:
+                return True
+        return False
+
+    def is_full(self) -> bool:
+        return (self.x | self.o) == self.rules.full
+
+    def winner(self) -> Optional[str]:
+        """
+        "X", "O", "draw", or None while the game is still open.
+        """
+        for mark in ("X", "O"):
+            if self.has_won(mark):
+                return mark
+        return "draw" if self.is_full() else None
+
+    def swapped(self) -> "Position":
+        """
+        The same board with X and O exchanged.
+        """
+        return _make(self.rules, self.o, self.x)
+
+    def features(self) -> List[int]:
+        """
+        Model features in row-major order: X=1, O=-1, empty=0.
+        """
+        x, o = self.x, self.o
+        return [1 if x >> idx & 1 else -1 if o >> idx & 1 else 0 for idx in range(self.rules.cells)]
+
+    def ternary(self) -> int:
+        """
+        Base-3 index (X=1, O=2, cell i weighs 3 ** i); a table lookup on 3x3.
+        """
+        if self.rules.cells == 9:
+            return TERNARY[self.x] + 2 * TERNARY[self.o]
+        idx = 0
+        weight = 1
+        for cell in range(self.rules.cells):
+            if self.x >> cell & 1:
+                idx += weight
+            elif self.o >> cell & 1:
+                idx += 2 * weight
+            weight *= 3
+        return idx
+
+
+_new = object.__new__
+_set_rules = Position.rules.__set__
+_set_x = Position.x.__set__
+_set_o = Position.o.__set__
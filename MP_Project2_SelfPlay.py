@@ -0,0 +1,321 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Headless self-play runner
+Overview:
+    Plays games between two agents with no input() or printing, so the
+    engines can be load-tested. Agents:
+        minimax - the Part B TicTacToe.get_best_move search
+        svc     - the Part C SVC model (TicTacToeML)
+        mcts    - Monte Carlo tree search (MP_Project2_MCTS), --playouts per move
+        random  - uniformly random legal moves
+        script  - replays recorded human "row,col" entries
+    After the run it reports games/sec, moves/sec and the distribution
+    of results.
+
+    Example:
+        python MP_Project2_SelfPlay.py --x random --o minimax --games 1000
+-----------------------------------------------------------------------------
+"""
+import argparse
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from MP_Project2_GameLog import GameLogWriter
+from MP_Project2_MCTS import MCTS
+from MP_Project2_PartB import Board, TicTacToe, winning_lines
+from MP_Project2_Solution import SolutionTable
+from MP_Project2_Stats import SearchStats
+
+
+def _swapMarks(board: Board) -> Board:
+    """
+    Copy of the board with X and O exchanged, so an O-only engine can play X.
+    """
+    swap = {"X": "O", "O": "X", " ": " "}
+    return [[swap[cell] for cell in row] for row in board]
+
+
+class Agent:
+    """
+    A player in a headless game. choose() returns (row, col) for 'mark'.
+    """
+
+    name = "agent"
+
+    def reset(self) -> None:
+        """
+        Called before every game.
+        """
+
+    def choose(self, board: Board, mark: str) -> Tuple[int, int]:
+        raise NotImplementedError
+
+
+class MinimaxAgent(Agent):
+    """
+    Part B search. The engine always plays O, so X positions are mirrored first.
+    """
+
+    name = "minimax"
+
+    def __init__(self, **engine_options):
+        self.engine = TicTacToe(**engine_options)
+
+    def choose(self, board: Board, mark: str) -> Tuple[int, int]:
+        self.engine.board = [row[:] for row in board] if mark == "O" else _swapMarks(board)
+        return self.engine.get_best_move()
+
+
+class SVCAgent(Agent):
+    """
+    Part C model. Like the minimax agent it sees X positions mirrored as O.
+    """
+
+    name = "svc"
+
+    def __init__(self, model):
+        # Imported here so the other agents do not need scikit-learn
+        from MP_Project2_PartC import TicTacToeML
+
+        self.game = TicTacToeML(model)
+
+    def choose(self, board: Board, mark: str) -> Tuple[int, int]:
+        self.game.board = [row[:] for row in board] if mark == "O" else _swapMarks(board)
+        return self.game._ml_choose()
+
+
+class MCTSAgent(Agent):
+    """
+    Monte Carlo tree search. The tree is kept across the moves of a game, so
+    each search starts from the subtree of the position it is asked about.
+    """
+
+    name = "mcts"
+
+    def __init__(self, **options):
+        self.mcts = MCTS(**options)
+        self.playouts = 0
+        self.seconds = 0.0
+
+    def reset(self) -> None:
+        self.mcts.clear()
+
+    def choose(self, board: Board, mark: str) -> Tuple[int, int]:
+        move = self.mcts.search([cell for row in board for cell in row], mark)
+        self.playouts += self.mcts.last["playouts"]
+        self.seconds += self.mcts.last["seconds"]
+        return move
+
+
+class RandomAgent(Agent):
+    """
+    Picks uniformly among the empty cells.
+    """
+
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def choose(self, board: Board, mark: str) -> Tuple[int, int]:
+        n = len(board)
+        free = [(r, c) for r in range(n) for c in range(n) if board[r][c] == " "]
+        return self.rng.choice(free)
+
+
+class ScriptedAgent(Agent):
+    """
+    Replays human entries in the same "row,col" format the prompt accepts.
+    Entries that would be rejected at the prompt are skipped, just like a re-prompt.
+    Each game starts again from the top of the script.
+    """
+
+    name = "script"
+
+    def __init__(self, entries: List[str]):
+        self.entries = entries
+        self.pos = 0
+
+    def reset(self) -> None:
+        self.pos = 0
+
+    def choose(self, board: Board, mark: str) -> Tuple[int, int]:
+        n = len(board)
+        while self.pos < len(self.entries):
+            parts = [x.strip() for x in self.entries[self.pos].split(",")]
+            self.pos += 1
+            if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+                continue
+            r, c = int(parts[0]), int(parts[1])
+            if 0 <= r < n and 0 <= c < n and board[r][c] == " ":
+                return r, c
+        raise RuntimeError("scripted agent ran out of moves")
+
+
+def play_game(
+    x_agent: Agent,
+    o_agent: Agent,
+    size: int = 3,
+    win_length: Optional[int] = None,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    Play one game silently. Returns ("X" | "O" | "draw", moves in order).
+    stats, shared by the agents that record into it, starts one game here.
+    """
+    lines = winning_lines(size, win_length if win_length is not None else size)
+    board: Board = [[" "] * size for _ in range(size)]
+    agents = {"X": x_agent, "O": o_agent}
+    x_agent.reset()
+    o_agent.reset()
+    if stats is not None:
+        stats.startGame()
+
+    moves: List[Tuple[int, int]] = []
+    current = "X"
+    while True:
+        r, c = agents[current].choose(board, current)
+        if board[r][c] != " ":
+            raise ValueError(f"{agents[current].name} played taken cell {r},{c}")
+        board[r][c] = current
+        moves.append((r, c))
+
+        # Only lines through the new mark can have been completed
+        for line in lines:
+            if (r, c) in line and all(board[rr][cc] == current for rr, cc in line):
+                return current, moves
+        if len(moves) == size * size:
+            return "draw", moves
+        current = "O" if current == "X" else "X"
+
+
+def run_matches(
+    x_agent: Agent,
+    o_agent: Agent,
+    games: int,
+    size: int = 3,
+    win_length: Optional[int] = None,
+    game_log: Optional[GameLogWriter] = None,
+    stats: Optional[SearchStats] = None,
+) -> Dict[str, object]:
+    """
+    Play 'games' games and return throughput and result counts.
+    Every game is also appended to game_log when one is given.
+    """
+    results = {"X": 0, "O": 0, "draw": 0}
+    total_moves = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        result, moves = play_game(x_agent, o_agent, size, win_length, stats)
+        if game_log is not None:
+            game_log.record(moves, result, x_agent.name, o_agent.name)
+        results[result] += 1
+        total_moves += len(moves)
+    seconds = time.perf_counter() - start
+
+    return {
+        "x_agent": x_agent.name,
+        "o_agent": o_agent.name,
+        "games": games,
+        "moves": total_moves,
+        "seconds": seconds,
+        "games_per_sec": games / seconds if seconds else 0.0,
+        "moves_per_sec": total_moves / seconds if seconds else 0.0,
+        "results": results,
+    }
+
+
+def make_agent(
+    kind: str, args: argparse.Namespace, seed: Optional[int], stats: Optional[SearchStats] = None
+) -> Agent:
+    """
+    Build an agent from its command-line name.
+    """
+    if kind == "minimax":
+        return MinimaxAgent(
+            solution=SolutionTable.load(),
+            size=args.size,
+            win_length=args.win_length,
+            time_budget=args.time_budget,
+            stats=stats,
+        )
+    if kind == "svc":
+        from MP_Project2_PartC import load_or_train_svc_model
+
+        return SVCAgent(load_or_train_svc_model())
+    if kind == "mcts":
+        return MCTSAgent(
+            size=args.size,
+            win_length=args.win_length,
+            playouts=args.playouts,
+            time_budget=args.time_budget,
+            seed=seed,
+        )
+    if kind == "random":
+        return RandomAgent(seed)
+    if kind == "script":
+        with open(args.script) as f:
+            return ScriptedAgent([line.strip() for line in f if line.strip()])
+    raise ValueError(f"unknown agent: {kind}")
+
+
+def main():
+    kinds = ["minimax", "svc", "mcts", "random", "script"]
+    parser = argparse.ArgumentParser(description="Headless Tic-Tac-Toe self-play.")
+    parser.add_argument("--x", choices=kinds, default="random", help="agent playing X")
+    parser.add_argument("--o", choices=kinds, default="minimax", help="agent playing O")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--script", default=None, help="file of 'row,col' lines for the script agent")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--time-budget", type=float, default=None)
+    parser.add_argument("--playouts", type=int, default=None, help="MCTS playouts per move")
+    parser.add_argument("--game-log", default=None, help="append every game to this binary log")
+    parser.add_argument("--stats", default=None, help="record minimax search statistics to this JSON lines file")
+    args = parser.parse_args()
+
+    search_stats = SearchStats(args.stats) if args.stats else None
+    try:
+        x_agent = make_agent(args.x, args, args.seed, search_stats)
+        o_agent = make_agent(args.o, args, None if args.seed is None else args.seed + 1, search_stats)
+    except ValueError as error:
+        parser.error(str(error))
+    try:
+        game_log = GameLogWriter(args.game_log, args.size) if args.game_log else None
+    except ValueError as error:
+        parser.error(str(error))
+    try:
+        stats = run_matches(x_agent, o_agent, args.games, args.size, args.win_length, game_log, search_stats)
+    finally:
+        if game_log is not None:
+            game_log.close()
+        if search_stats is not None:
+            search_stats.close()
+
+    print(f"{stats['x_agent']} (X) vs {stats['o_agent']} (O): {stats['games']} games")
+    print(f"{stats['games_per_sec']:.1f} games/sec, {stats['moves_per_sec']:.1f} moves/sec")
+    results = stats["results"]
+    for outcome in ("X", "O", "draw"):
+        share = 100.0 * results[outcome] / stats["games"] if stats["games"] else 0.0
+        print(f"  {outcome:>4}: {results[outcome]} ({share:.1f}%)")
+    for agent in (x_agent, o_agent):
+        if isinstance(agent, MCTSAgent) and agent.seconds:
+            print(
+                f"MCTS ({'X' if agent is x_agent else 'O'}): {agent.playouts / agent.seconds:.0f} playouts/sec, "
+                f"{agent.mcts.bytes_per_node()} bytes per node"
+            )
+    if search_stats is not None:
+        totals = search_stats.totals()
+        print(
+            f"Search: {totals['moves']} moves, {totals['nodes']} nodes, max depth {totals['max_depth']}, "
+            f"{totals['seconds']:.3f}s, {totals['cutoffs']} cutoffs, {totals['tt_hits']} table hits"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Multi-session game server
+Overview:
+    An asyncio TCP server that hosts many independent games at once.
+    Each connection is one session; the human always plays X and the
+    server plays O with either opponent:
+        minimax - the Part B engine (solution table + search)
+        svc     - the Part C SVC model (compiled move table)
+    One minimax engine (with the solution table) and one SVC player (with
+    its compiled move table) are loaded when the server starts and shared
+    by every session through their reentrant analyze()/predictMove() calls;
+    each session only keeps its own board. The O moves run in a thread
+    pool, so a slow search never blocks the event loop or the other sessions.
+    With --game-log every finished game is appended to a binary game log.
+
+    Protocol (one line each way, UTF-8):
+        client: NEW minimax | NEW svc    start a game (X moves first)
+        client: row,col                  X's move, same format as the prompt
+        client: BOARD                    show the current board
+        client: QUIT                     close the session
+        server: BOARD <cells>            row-major cells, "." for empty
+        server: MOVE row,col             O's reply
+        server: TURN X                   waiting for X's move
+        server: RESULT X | O | DRAW      the game is over
+        server: ERROR <message>          the line was rejected
+
+    Example:
+        python MP_Project2_Server.py --port 8765 --workers 4
+-----------------------------------------------------------------------------
+"""
+import argparse
+import asyncio
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from MP_Project2_GameLog import GameLogWriter
+from MP_Project2_PartB import Position, TicTacToe
+from MP_Project2_Solution import SolutionTable
+
+OPPONENTS = ("minimax", "svc")
+
+# How often buffered game-log records are pushed to disk
+LOG_FLUSH_SECONDS = 5.0
+
+
+class SharedEngines:
+    """
+    Everything the sessions share: the minimax engine with the solution table,
+    the SVC player with its compiled move table, and the thread pool that
+    computes O's moves.
+    """
+
+    def __init__(self, workers: int = 4, svc: bool = True, game_log: Optional[GameLogWriter] = None):
+        self.minimax = TicTacToe(solution=SolutionTable.load())
+        self.game_log = game_log
+        self.svc = None
+        if svc:
+            self._loadSvc()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tictactoe-move")
+
+    def _loadSvc(self) -> None:
+        try:
+            # Imported here so the server runs without scikit-learn for minimax-only use
+            from MP_Project2_PartC import TicTacToeML, compile_move_table, load_or_train_svc_model
+
+            model = load_or_train_svc_model()
+            self.svc = TicTacToeML(model, move_table=compile_move_table(model))
+        except (ImportError, OSError) as err:
+            print(f"SVC opponent disabled: {err}")
+
+    def opponents(self) -> Tuple[str, ...]:
+        if self.svc is None:
+            return ("minimax",)
+        return OPPONENTS
+
+    def chooseMove(self, opponent: str, position: Position) -> Tuple[int, int]:
+        """
+        O's move on 'position'; runs in the thread pool.
+        """
+        if opponent == "svc":
+            return self.svc.predictMove(position)
+        return self.minimax.analyze(position, "O")[0]
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+        if self.game_log is not None:
+            self.game_log.close()
+
+
+def format_board(board) -> str:
+    return "".join(board[r][c] if board[r][c] != " " else "." for r in range(3) for c in range(3))
+
+
+def parse_move(text: str) -> Optional[Tuple[int, int]]:
+    """
+    (row, col) for a "row,col" entry, or None if it is not two integers.
+    """
+    parts = [x.strip() for x in text.split(",")]
+    if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+        return None
+    return int(parts[0]), int(parts[1])
+
+
+class GameSession:
+    """
+    One connection: reads commands, applies X's moves and answers with O's.
+    """
+
+    def __init__(self, engines: SharedEngines, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.engines = engines
+        self.reader = reader
+        self.writer = writer
+        self.game: Optional[TicTacToe] = None
+        self.opponent = ""
+        self.over = True
+
+    def send(self, line: str) -> None:
+        self.writer.write((line + "\n").encode())
+
+    async def run(self) -> None:
+        self.send(f"HELLO opponents {' '.join(self.engines.opponents())}")
+        while True:
+            await self.writer.drain()
+            raw = await self.reader.readline()
+            if not raw:
+                return
+            line = raw.decode(errors="replace").strip()
+            if not line:
+                continue
+            command = line.split()[0].upper()
+            if command == "QUIT":
+                self.send("BYE")
+                await self.writer.drain()
+                return
+            if command == "NEW":
+                self.startGame(line.split()[1:])
+            elif command == "BOARD":
+                if self.game is None:
+                    self.send("ERROR no game; send NEW minimax or NEW svc")
+                else:
+                    self.send(f"BOARD {format_board(self.game.board)}")
+            else:
+                await self.playMove(line)
+
+    def startGame(self, args) -> None:
+        opponent = args[0].lower() if args else "minimax"
+        if opponent not in self.engines.opponents():
+            self.send(f"ERROR unknown opponent {opponent}")
+            return
+        self.opponent = opponent
+        self.game = TicTacToe(game_log=self.engines.game_log)
+        self.over = False
+        self.send(f"BOARD {format_board(self.game.board)}")
+        self.send("TURN X")
+
+    def _finished(self, mark: str) -> bool:
+        """
+        Send the result if 'mark' just ended the game.
+        """
+        if self.game.checkWin(mark):
+            self.send(f"RESULT {mark}")
+        elif self.game.checkFull():
+            self.send("RESULT DRAW")
+        else:
+            return False
+        self.over = True
+        self.game._logGame(mark, "human", self.opponent)
+        return True
+
+    async def playMove(self, line: str) -> None:
+        if self.game is None or self.over:
+            self.send("ERROR no game in progress; send NEW minimax or NEW svc")
+            return
+        move = parse_move(line)
+        if move is None:
+            self.send("ERROR expected row,col")
+            return
+        r, c = move
+        if not self.game.validateEntry(r, c):
+            self.send("ERROR out of range or cell already taken")
+            return
+
+        self.game.makeMove(r, c, "X")
+        if self.game.checkWin("X") or self.game.checkFull():
+            self.send(f"BOARD {format_board(self.game.board)}")
+            self._finished("X")
+            return
+
+        loop = asyncio.get_running_loop()
+        r, c = await loop.run_in_executor(
+            self.engines.executor, self.engines.chooseMove, self.opponent, self.game.position()
+        )
+        self.game.makeMove(r, c, "O")
+        self.send(f"MOVE {r},{c}")
+        self.send(f"BOARD {format_board(self.game.board)}")
+        if not self._finished("O"):
+            self.send("TURN X")
+
+
+async def serve(host: str, port: int, engines: SharedEngines) -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await GameSession(engines, reader, writer).run()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def flush_log() -> None:
+        # Bounds what a crash can lose from the game log's write buffer
+        while True:
+            await asyncio.sleep(LOG_FLUSH_SECONDS)
+            engines.game_log.flush()
+
+    serve_task = asyncio.current_task()
+    try:
+        # SIGTERM stops the server the same way Ctrl+C does, so the log is closed cleanly
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serve_task.cancel)
+    except (NotImplementedError, AttributeError):
+        pass
+
+    server = await asyncio.start_server(handle, host, port, backlog=4096)
+    print(f"Serving Tic-Tac-Toe on {host}:{port} (opponents: {', '.join(engines.opponents())})")
+    if engines.game_log is not None:
+        flusher = asyncio.create_task(flush_log())
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        print("\nServer stopped.")
+    finally:
+        if engines.game_log is not None:
+            flusher.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Tic-Tac-Toe games over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4, help="threads computing O's moves")
+    parser.add_argument("--no-svc", action="store_true", help="only offer the minimax opponent")
+    parser.add_argument("--game-log", default=None, help="append finished games to this binary log")
+    args = parser.parse_args()
+
+    try:
+        game_log = GameLogWriter(args.game_log) if args.game_log else None
+    except ValueError as error:
+        parser.error(str(error))
+    engines = SharedEngines(args.workers, svc=not args.no_svc, game_log=game_log)
+    try:
+        asyncio.run(serve(args.host, args.port, engines))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    finally:
+        engines.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Precomputed perfect-play table
+Overview:
+    Solves every reachable position where O (the computer) is to move
+    once, using the Part B minimax, and writes the value and best move
+    of each one into a small binary file. The game loads that file at
+    startup (memory-mapped when possible), so picking the computer's move
+    becomes a single index lookup. If the file is missing, has the wrong
+    version or fails its checksum, the game falls back to live search.
+
+    File layout: a header (magic, version, cell count, entry count,
+    CRC32 of the payload) followed by 3**9 bytes, one per base-3 board
+    index. Each byte is (value + 1) << 4 | move index, or 0xFF when the
+    position is unreachable or not O's turn.
+
+    Run this file directly to (re)build the table.
+-----------------------------------------------------------------------------
+"""
+import mmap
+import struct
+import zlib
+from typing import Optional, Tuple
+
+from MP_Project2_Bitboard import BitBoard, reachable
+from MP_Project2_Position import Position
+
+SOLUTION_FILE = "tictac_solution.bin"
+SOLUTION_MAGIC = b"TTTS"
+# Bump whenever the scoring or tie-breaking of the builder changes
+SOLUTION_VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")
+TABLE_SIZE = 3 ** 9
+NO_ENTRY = 0xFF
+
+
+def ternary_index(board) -> int:
+    """
+    Base-3 index of a board (X=1, O=2, empty=0, cell i weighs 3 ** i).
+    """
+    if isinstance(board, (BitBoard, Position)):
+        return board.ternary()
+    idx = 0
+    weight = 1
+    for row in board:
+        for cell in row:
+            if cell == "X":
+                idx += weight
+            elif cell == "O":
+                idx += 2 * weight
+            weight *= 3
+    return idx
+
+
+def build_solution_table(path: str = SOLUTION_FILE) -> int:
+    """
+    Solve every reachable O-to-move position and write the table to path.
+    Returns the number of positions stored.
+    """
+    # Imported here because Part B loads this module at startup
+    from MP_Project2_PartB import TicTacToe
+
+    game = TicTacToe(search="minimax")
+    payload = bytearray([NO_ENTRY]) * TABLE_SIZE
+    positions = reachable("O")
+
+    for x, o in positions:
+        position = Position(x, o)
+        game.board = position
+        r, c = game.get_best_move()
+        value = game.minimax(position.play(r, c, "O").rows(), False)
+        payload[position.ternary()] = (value + 1) << 4 | (r * 3 + c)
+
+    header = HEADER.pack(
+        SOLUTION_MAGIC, SOLUTION_VERSION, 9, len(positions), zlib.crc32(payload)
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    return len(positions)
+
+
+class SolutionTable:
+    """
+    Read-only view of a solution file; lookup() is one index into the payload.
+    """
+
+    def __init__(self, data, count: int):
+        self.data = data
+        self.count = count
+        self.offset = HEADER.size
+
+    @classmethod
+    def load(cls, path: str = SOLUTION_FILE) -> Optional["SolutionTable"]:
+        """
+        Map the file into memory and verify it.
+        Returns None if it is missing, truncated, from another version or corrupt.
+        """
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return None
+
+        with f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                data = f.read()
+
+        if len(data) != HEADER.size + TABLE_SIZE:
+            return None
+        magic, version, cells, count, crc = HEADER.unpack_from(data, 0)
+        if magic != SOLUTION_MAGIC or version != SOLUTION_VERSION or cells != 9:
+            return None
+        if zlib.crc32(data[HEADER.size:]) != crc:
+            return None
+        return cls(data, count)
+
+    def lookup(self, board) -> Optional[Tuple[int, int]]:
+        """
+        (value for O, move index) for an O-to-move board, or None if not stored.
+        """
+        byte = self.data[self.offset + ternary_index(board)]
+        if byte == NO_ENTRY:
+            return None
+        return (byte >> 4) - 1, byte & 0x0F
+
+
+def main():
+    count = build_solution_table()
+    print(f"Solved {count} positions into {SOLUTION_FILE}")
+
+
+if __name__ == "__main__":
+    main()
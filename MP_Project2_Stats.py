@@ -0,0 +1,118 @@
+"""
+-----------------------------------------------------------------------------
+Name: Maitrey Vivek Phatak
+Course: MS in APPLIED DATA SCIENCE
+Date: October 18, 2026
+Program: TicTacToe - Search statistics
+Overview:
+    Opt-in instrumentation for the Part B engine. Pass a SearchStats to
+    TicTacToe(stats=...) and every computer move records
+        nodes      positions visited
+        max_depth  deepest ply reached below the root
+        seconds    wall time of the move
+        branching  effective branching factor, nodes ** (1 / max_depth)
+        cutoffs    alpha-beta cutoffs (0 for minimax)
+        tt_hits / tt_misses   transposition table lookups during the move
+        source     "solution", "minimax", "alphabeta", "mcts" or "parallel",
+                   or "ponder" for a reply searched while X was thinking
+                   (its seconds are background time, not time X waited)
+    along with running totals for the current game and for the whole
+    process. Records can be read from .moves / .game / PROCESS_TOTALS or
+    written as JSON lines. With stats=None the engine only pays for one
+    attribute check per node.
+    Nodes searched inside pool workers (workers > 1) are not counted;
+    for MCTS, nodes are playouts and max_depth is the deepest tree node.
+-----------------------------------------------------------------------------
+"""
+import json
+import threading
+from typing import Dict, List, Optional
+
+TOTAL_FIELDS = ("moves", "nodes", "seconds", "cutoffs", "tt_hits", "tt_misses")
+
+# Totals over every SearchStats in this process
+PROCESS_TOTALS: Dict[str, float] = {field: 0 for field in TOTAL_FIELDS}
+_PROCESS_LOCK = threading.Lock()
+
+
+def _zero_totals() -> Dict[str, float]:
+    totals: Dict[str, float] = {field: 0 for field in TOTAL_FIELDS}
+    totals["max_depth"] = 0
+    return totals
+
+
+class SearchStats:
+    """
+    Per-move search records plus per-game and per-process totals.
+    If path is given each record is also appended to it as one JSON line.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.moves: List[Dict[str, object]] = []
+        self.game = _zero_totals()
+        self.games = 0
+        self.lock = threading.Lock()
+        self.file = open(path, "a") if path else None
+
+    def startGame(self) -> None:
+        """
+        Reset the per-game totals.
+        """
+        with self.lock:
+            self.game = _zero_totals()
+            self.games += 1
+
+    def record(self, entry: Dict[str, object]) -> None:
+        """
+        Add one move's record to the history and the running totals.
+        """
+        with self.lock:
+            entry["game"] = self.games
+            self.moves.append(entry)
+            for field in TOTAL_FIELDS[1:]:
+                self.game[field] += entry[field]
+            self.game["moves"] += 1
+            self.game["max_depth"] = max(self.game["max_depth"], entry["max_depth"])
+            if self.file is not None:
+                self.file.write(json.dumps(entry) + "\n")
+        with _PROCESS_LOCK:
+            for field in TOTAL_FIELDS[1:]:
+                PROCESS_TOTALS[field] += entry[field]
+            PROCESS_TOTALS["moves"] += 1
+
+    def totals(self) -> Dict[str, float]:
+        """
+        Totals over every recorded move.
+        """
+        totals = _zero_totals()
+        for entry in self.moves:
+            for field in TOTAL_FIELDS[1:]:
+                totals[field] += entry[field]
+            totals["max_depth"] = max(totals["max_depth"], entry["max_depth"])
+        totals["moves"] = len(self.moves)
+        return totals
+
+    def dump(self, path: str) -> None:
+        """
+        Write every recorded move to path as JSON lines.
+        """
+        with open(path, "w") as f:
+            for entry in self.moves:
+                f.write(json.dumps(entry) + "\n")
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def describe(entry: Dict[str, object]) -> str:
+    """
+    One-line summary of a move record.
+    """
+    return (
+        f"{entry['source']}: {entry['nodes']} nodes, depth {entry['max_depth']}, "
+        f"{entry['seconds'] * 1e3:.2f} ms, branching {entry['branching']:.2f}, "
+        f"{entry['cutoffs']} cutoffs, {entry['tt_hits']} table hits"
+    )